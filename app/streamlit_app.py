@@ -1,153 +1,301 @@
 import datetime as dt
+import json
 import time
+from pathlib import Path
 
-import folium
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 import streamlit as st
-from skyfield.api import EarthSatellite, load, wgs84
-from streamlit_folium import st_folium
+import streamlit.components.v1 as components
+from sgp4.api import accelerated as sgp4_accelerated
+
+from src.orbits._kernels import simplify_polyline, split_antimeridian
+
+# Skyfield, the src.orbits modules that pull it in, Folium and Plotly are imported
+# inside the cached factories and the branches that use them, so pages that never
+# predict or plot anything don't pay for those imports.
+
+# Satellite presets shared by the tracker and visualizer pickers; None means "enter an ID"
+SATELLITE_OPTIONS = (
+    ("International Space Station (ISS)", 25544),
+    ("Hubble Space Telescope", 20580),
+    ("Starlink-1007", 44713),
+    ("NOAA-18", 28654),
+    ("Terra (EOS AM-1)", 25994),
+    ("Custom NORAD ID", None),
+)
+SATELLITE_LABELS = tuple(label for label, _ in SATELLITE_OPTIONS)
+SATELLITE_NORADS = dict(SATELLITE_OPTIONS)
+
+# Name keywords that place a catalog entry in each database filter category
+CATEGORY_KEYWORDS = {
+    "Weather": frozenset({"NOAA", "METEOR"}),
+    "Communications": frozenset({"STARLINK", "GSAT", "IRNSS"}),
+    "Navigation": frozenset({"IRNSS"}),
+    "Earth Observation": frozenset({"TERRA"}),
+    "Science": frozenset({"ISS", "HST"}),
+    "Military": frozenset(),
+}
 
-from src.orbits.pass_predictor_optimized import compute_passes_optimized, fetch_tle_cached
+# Settings location presets: (name, latitude, longitude, altitude in m)
+LOCATION_PRESETS = (
+    ("New Delhi, India", 28.6139, 77.2090, 0),
+    ("London, UK", 51.5074, -0.1278, 0),
+    ("New York, USA", 40.7128, -74.0060, 0),
+    ("Tokyo, Japan", 35.6762, 139.6503, 0),
+    ("Sydney, Australia", -33.8688, 151.2093, 0),
+    ("Cape Canaveral, USA", 28.5384, -80.6479, 0),
+)
 
-# Enhanced page config
-st.set_page_config(
-    page_title="Space Exploration AI",
-    page_icon="🛰️",
-    layout="wide",
-    initial_sidebar_state="expanded",
-    menu_items={
-        'Get Help': 'https://github.com/your-repo/space-expo',
-        'Report a bug': 'https://github.com/your-repo/space-expo/issues',
-        'About': 'Advanced Satellite Pass Prediction & Orbital Analytics'
-    }
+# About page tables: (name, description)
+TECH_STACK = (
+    ("Python", "Core programming language"),
+    ("Skyfield", "Orbital mechanics library"),
+    ("Streamlit", "Web application framework"),
+    ("Plotly", "Interactive visualizations"),
+    ("Folium", "Interactive maps"),
+    ("NumPy", "Numerical computations"),
+    ("Pandas", "Data manipulation"),
+    ("Requests", "HTTP client"),
+)
+KEY_FEATURES = (
+    ("🛰️ Real-Time Tracking", "Live satellite position monitoring"),
+    ("📊 Advanced Predictions", "High-precision pass calculations"),
+    ("🗺️ Orbital Visualization", "Interactive 2D/3D trajectory maps"),
+    ("📡 TLE Integration", "Direct Celestrak database access"),
+    ("⚡ Performance Optimized", "Vectorized computations and caching"),
+    ("📱 Responsive Design", "Works on desktop and mobile devices"),
+    ("💾 Data Export", "CSV/JSON export capabilities"),
+    ("🔬 Scientific Accuracy", "Research-grade orbital calculations"),
 )
 
-# Enhanced CSS with dark mode support
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+# Cached pass predictions are reused for at most this many seconds of wall-clock time
+PASS_CACHE_S = 600
 
-    * {
-        font-family: 'Inter', sans-serif;
-    }
+# Database "Sort by" choice -> (catalog column, ascending)
+SORT_COLUMNS = {
+    "Name": ("name", True),
+    "NORAD ID": ("norad", True),
+    "Launch Date": ("launch_date", False),
+}
 
-    .main-header {
-        font-size: 3rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 2rem;
-        line-height: 1.2;
-    }
 
-    .hero-section {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 3rem 2rem;
-        border-radius: 20px;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
+@st.cache_resource
+def get_timescale():
+    """Build the Skyfield timescale once per process and share it across reruns."""
+    from skyfield.api import load
 
-    .feature-card {
-        background: rgba(255,255,255,0.1);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255,255,255,0.2);
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 0.5rem;
-        transition: transform 0.3s ease;
-    }
+    return load.timescale(builtin=True)
 
-    .feature-card:hover {
-        transform: translateY(-5px);
-    }
 
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-radius: 15px;
-        padding: 1.5rem;
-        text-align: center;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-    }
+@st.cache_data(ttl=7200, show_spinner=False)
+def get_tle(norad: int):
+    """Fetch a TLE at most once per two hours per NORAD ID, matching Celestrak's update cadence.
 
-    .status-indicator {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        border-radius: 50%;
-        margin-right: 8px;
-    }
+    Misses go through the predictor's on-disk store, so a restart revalidates instead of refetching.
+    """
+    from src.orbits.pass_predictor import fetch_tle
 
-    .status-active { background-color: #00ff00; }
-    .status-inactive { background-color: #ff4444; }
+    return fetch_tle(norad)
 
-    .satellite-card {
-        background: #f8f9fa;
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border-left: 5px solid #667eea;
-        transition: all 0.3s ease;
-    }
 
-    .satellite-card:hover {
-        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-        transform: translateY(-2px);
-    }
+@st.cache_data(ttl=7200, show_spinner=False)
+def get_tles(norads: tuple):
+    """Fetch several TLEs concurrently; cached per ID tuple like ``get_tle``."""
+    from src.orbits.pass_predictor import fetch_tles
 
-    .pass-table {
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-    }
+    return fetch_tles(norads)
 
-    .real-time-display {
-        background: #1a1a1a;
-        color: #00ff00;
-        font-family: 'Courier New', monospace;
-        padding: 1rem;
-        border-radius: 10px;
-        border: 2px solid #333;
-    }
 
-    .control-panel {
-        background: #f8f9fa;
-        border-radius: 15px;
-        padding: 2rem;
-        margin-bottom: 2rem;
-        border: 1px solid #e9ecef;
-    }
+@st.cache_resource
+def get_sat(l1: str, l2: str, name: str):
+    """Build the SGP4 model once per TLE; a refreshed TLE gets a new cache key."""
+    from skyfield.api import EarthSatellite
 
-    .tab-content {
-        padding: 2rem 0;
-    }
+    return EarthSatellite(l1, l2, name, get_timescale())
 
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
 
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 10px 10px 0 0;
-        padding: 10px 20px;
-        background-color: #f1f3f4;
-    }
+@st.cache_resource
+def get_satellite_db() -> pd.DataFrame:
+    """Read-only satellite catalog shared by every session (simplified - a real app would fetch from Celestrak).
+
+    Stored column-wise with lowercased ``name_lc`` and stringified ``norad_str`` columns so searches are
+    vectorized substring matches,
+    and a ``category_tags`` column holding the ``CATEGORY_KEYWORDS`` categories each name matches, so the
+    category filter is a set lookup instead of a keyword scan per query.
+    """
+    db = pd.DataFrame({
+        "norad": [25544, 20580, 44713, 28654, 25994, 40069, 41866, 43013],
+        "name": ["ISS (ZARYA)", "HST", "STARLINK-1007", "NOAA 18", "TERRA", "METEOR-M2", "IRNSS-1I", "GSAT-11"],
+        "category": ["Science", "Science", "Communications", "Weather", "Earth Observation", "Weather",
+                     "Navigation", "Communications"],
+        "active": [True] * 8,
+        "launch_date": ["1998-11-20", "1990-04-24", "2019-11-11", "2005-05-20", "1999-12-18", "2014-07-08",
+                        "2018-04-12", "2018-12-19"],
+    })
+    db["name_lc"] = db["name"].str.lower()
+    db["norad_str"] = db["norad"].astype(str)
+    db["category_tags"] = [
+        frozenset(category for category, keywords in CATEGORY_KEYWORDS.items()
+                  if any(keyword in name for keyword in keywords))
+        for name in db["name"]
+    ]
+    return db
 
-    .stTabs [aria-selected="true"] {
-        background-color: #667eea !important;
-        color: white !important;
+
+@st.cache_data(show_spinner=False)
+def filter_satellite_db(search_term: str, category_filter: str, show_active_only: bool, sort_by: str) -> pd.DataFrame:
+    """Search, filter and sort the catalog with boolean masks; cached per query so reruns don't re-scan it."""
+    db = get_satellite_db()
+    mask = np.ones(len(db), dtype=bool)
+
+    if search_term:
+        search_lc = search_term.lower()
+        mask &= (db["name_lc"].str.contains(search_lc, regex=False) |
+                 db["norad_str"].str.contains(search_term, regex=False)).to_numpy()
+
+    if category_filter != "All":
+        mask &= np.fromiter((category_filter in tags for tags in db["category_tags"]), dtype=bool, count=len(db))
+
+    if show_active_only:
+        mask &= db["active"].to_numpy()
+
+    filtered_db = db[mask]
+
+    # Sort results
+    if sort_by in SORT_COLUMNS:
+        column, ascending = SORT_COLUMNS[sort_by]
+        filtered_db = filtered_db.sort_values(column, ascending=ascending, kind="stable")
+
+    return filtered_db
+
+
+@st.cache_resource
+def satellite_db_stats() -> dict:
+    """Whole-catalog aggregates; the catalog is static, so they're computed once per process."""
+    db = get_satellite_db()
+    category_counts = db["category"].value_counts()
+    return {
+        "total": len(db),
+        "active": int(db["active"].sum()),
+        "top_category": category_counts.index[0],
+        "top_category_count": int(category_counts.iloc[0]),
+        "category_counts": category_counts,
     }
 
-    @media (max-width: 768px) {
-        .main-header { font-size: 2rem; }
-        .hero-section { padding: 2rem 1rem; }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def export_satellite_db(search_term: str, category_filter: str, show_active_only: bool, sort_by: str) -> bytes:
+    """CSV of a filtered catalog view, keyed on the filter settings rather than on a hash of the table."""
+    filtered_db = filter_satellite_db(search_term, category_filter, show_active_only, sort_by)
+    return filtered_db.drop(columns=["name_lc", "norad_str", "category_tags"]).to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a table for download once per distinct table, as UTF-8 bytes."""
+    return df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_map_html(segments: list, start_popup: str, end_popup: str, current=None) -> str:
+    """Render the ground-track map to HTML once per track.
+
+    ``segments`` holds one list of [lat, lon] pairs per antimeridian-free stretch;
+    ``current`` is (lat, lon, alt_km) or None.
+    """
+    import folium
+
+    start, end = segments[0][0], segments[-1][-1]
+    m = folium.Map(
+        location=list(start),
+        zoom_start=2,
+        tiles='CartoDB positron',
+        prefer_canvas=True
+    )
+
+    # Add ground track
+    folium.PolyLine(
+        segments,
+        color="#FF6B6B",
+        weight=3,
+        opacity=0.8,
+        popup="Satellite Ground Track"
+    ).add_to(m)
+
+    # Add start and end markers
+    folium.Marker(
+        list(start),
+        popup=start_popup,
+        icon=folium.Icon(color='green', icon='play')
+    ).add_to(m)
+
+    folium.Marker(
+        list(end),
+        popup=end_popup,
+        icon=folium.Icon(color='red', icon='stop')
+    ).add_to(m)
+
+    if current is not None:
+        folium.Marker(
+            [current[0], current[1]],
+            popup=f"Current Position<br>Alt: {current[2]:.1f} km",
+            icon=folium.Icon(color='blue', icon='satellite')
+        ).add_to(m)
+
+    return m.get_root().render()
+
+
+@st.cache_data(ttl=PASS_CACHE_S, show_spinner=False)
+def cached_passes(norad: int, lat: float, lon: float, alt: float, hours_ahead: int, min_elev: float, slot: int):
+    """Memoize a single-satellite prediction on its primitive inputs so identical reruns skip propagation.
+
+    Runs the same predictor as the multi-satellite batch, so one satellite gets the same passes either way.
+    ``slot`` is the current ``PASS_CACHE_S`` time slot; it only keys the cache, so a hit is never
+    computed from a "now" more than one slot old.
+    """
+    from src.orbits.pass_predictor import compute_pass_arrays
+
+    name, l1, l2 = get_tle(norad)
+    return name, compute_pass_arrays(get_sat(l1, l2, name), get_site(lat, lon, alt), hours_ahead, min_elev)
+
+
+@st.cache_resource(max_entries=64)
+def get_site(lat: float, lon: float, alt_m: float):
+    """Share the observer's ITRF position and ENU basis; callers round the key to absorb input noise."""
+    from src.orbits.pass_predictor import observer_site
+
+    return observer_site(lat, lon, alt_m)
+
+
+@st.cache_resource
+def load_css() -> str:
+    """Read the app stylesheet once per process, already wrapped in its <style> tag."""
+    css = (Path(__file__).parent / "static" / "styles.css").read_text(encoding="utf-8")
+    return f"<style>{css}</style>"
+
+
+# Enhanced page config
+st.set_page_config(
+    page_title="Space Exploration AI",
+    page_icon="🛰️",
+    layout="wide",
+    initial_sidebar_state="expanded",
+    menu_items={
+        'Get Help': 'https://github.com/your-repo/space-expo',
+        'Report a bug': 'https://github.com/your-repo/space-expo/issues',
+        'About': 'Advanced Satellite Pass Prediction & Orbital Analytics'
     }
-</style>
-""", unsafe_allow_html=True)
+)
+
+# Enhanced CSS with dark mode support. Streamlit drops elements that a rerun doesn't
+# re-emit, so a one-shot session_state guard would lose the styles after the first
+# rerun; the <style> tag is sent every run, but it is read and built only once.
+st.markdown(load_css(), unsafe_allow_html=True)
+
+# SatrecArray and EarthSatellite fall back to pure-Python SGP4 without the C extension
+if not sgp4_accelerated:
+    st.warning("⚠️ sgp4 C extension not loaded; orbit propagation will be roughly 30× slower.")
 
 # Initialize session state
 if 'current_satellite' not in st.session_state:
@@ -267,8 +415,17 @@ elif menu_options[selected_menu] == "tracker":
     st.markdown("### 🛰️ Advanced Satellite Pass Predictor")
     st.markdown("Predict and analyze satellite passes with high precision and real-time data")
 
-    # Control Panel
-    with st.container():
+    # Satellite choice stays outside the form so picking "Custom NORAD ID" reveals its input at once
+    st.markdown("#### 🛰️ Satellite Selection")
+    selected_sat = st.selectbox(
+        "Choose Satellite",
+        options=SATELLITE_LABELS,
+        index=0,
+        help="Select from popular satellites or enter custom NORAD ID"
+    )
+
+    # Control Panel: widgets inside the form only rerun the script when it is submitted
+    with st.form("tracker_form", clear_on_submit=False, border=False):
         st.markdown('<div class="control-panel">', unsafe_allow_html=True)
 
         # Location Settings
@@ -301,39 +458,26 @@ elif menu_options[selected_menu] == "tracker":
                 help="Observer altitude above sea level"
             )
 
-        # Satellite Selection
-        st.markdown("#### 🛰️ Satellite Selection")
-        satellite_options = {
-            "International Space Station (ISS)": 25544,
-            "Hubble Space Telescope": 20580,
-            "Starlink-1007": 44713,
-            "NOAA-18": 28654,
-            "Terra (EOS AM-1)": 25994,
-            "Custom NORAD ID": None
-        }
-
-        selected_sat = st.selectbox(
-            "Choose Satellite",
-            options=list(satellite_options.keys()),
-            index=0,
-            help="Select from popular satellites or enter custom NORAD ID"
-        )
-
-        if satellite_options[selected_sat] is None:
-            norad = st.number_input(
-                "NORAD Catalog ID",
-                value=25544,
-                min_value=1,
-                step=1,
-                help="NORAD catalog number for the satellite"
+        if SATELLITE_NORADS[selected_sat] is None:
+            norad_text = st.text_input(
+                "NORAD Catalog ID(s)",
+                value="25544",
+                help="NORAD catalog number, or several separated by commas to predict them together"
             )
+            try:
+                norads = [int(token) for token in norad_text.split(",") if token.strip()]
+            except ValueError:
+                norads = []
+            if not norads or min(norads) < 1:
+                st.error("❌ Enter one or more positive NORAD IDs separated by commas")
+                norads = []
         else:
-            norad = satellite_options[selected_sat]
-            st.info(f"📡 NORAD ID: {norad}")
+            norads = [SATELLITE_NORADS[selected_sat]]
+            st.info(f"📡 NORAD ID: {norads[0]}")
 
         # Prediction Parameters
         st.markdown("#### ⚙️ Prediction Settings")
-        col1, col2, col3 = st.columns(3)
+        col1, col2 = st.columns(2)
         with col1:
             hours_ahead = st.slider(
                 "Hours Ahead",
@@ -350,196 +494,213 @@ elif menu_options[selected_menu] == "tracker":
                 value=10,
                 help="Minimum elevation angle for visible passes"
             )
-        with col3:
-            time_res = st.slider(
-                "Time Resolution (min)",
-                min_value=0.5,
-                max_value=5.0,
-                value=1.0,
-                step=0.5,
-                help="Smaller values = more accurate but slower"
-            )
 
         st.markdown('</div>', unsafe_allow_html=True)
 
-    # Prediction Button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        predict_btn = st.button(
-            "🚀 Compute Satellite Passes",
-            type="primary",
-            use_container_width=True,
-            help="Calculate upcoming satellite passes for your location"
-        )
+        # Prediction Button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            predict_btn = st.form_submit_button(
+                "🚀 Compute Satellite Passes",
+                type="primary",
+                use_container_width=True,
+                help="Calculate upcoming satellite passes for your location"
+            )
+
+    if predict_btn and len(norads) > 1:
+        from src.orbits.pass_predictor import PassArrays, compute_passes_batch
 
-    if predict_btn:
         with st.spinner("🔄 Fetching TLE data and computing passes..."):
             try:
-                # Progress indicators
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                status_text.text("📡 Fetching satellite TLE data...")
-                progress_bar.progress(20)
-                name, l1, l2 = fetch_tle_cached(int(norad))
-
-                status_text.text("🛰️ Creating satellite model...")
-                progress_bar.progress(40)
-                ts = load.timescale()
-                sat = EarthSatellite(l1, l2, name, ts)
-
-                status_text.text("⚡ Computing pass predictions...")
-                progress_bar.progress(60)
-                start_time = time.time()
-                passes = compute_passes_optimized(
-                    sat, lat, lon, alt, hours_ahead, min_elev, time_res
-                )
-                computation_time = time.time() - start_time
-
-                progress_bar.progress(100)
-                status_text.text("✅ Computation completed!")
-                time.sleep(0.5)
-                progress_bar.empty()
-                status_text.empty()
-
-                # Results Section
-                if passes:
-                    st.success(f"Found {len(passes)} satellite passes for {name}")
-
-                    # Summary Metrics
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("Total Passes", len(passes))
-                    with col2:
-                        avg_elev = sum(p.max_elevation_deg for p in passes) / len(passes)
-                        st.metric("Avg Max Elevation", f"{avg_elev:.1f}°")
-                    with col3:
-                        total_duration = sum((p.end - p.start).total_seconds() for p in passes) / 60
-                        st.metric("Total Duration", f"{total_duration:.1f} min")
-                    with col4:
-                        st.metric("Computation Time", f"{computation_time:.2f}s")
-
-                    # Enhanced Results Table
-                    st.markdown("#### 📋 Pass Schedule")
+                sats = [get_sat(l1, l2, name) for name, l1, l2 in get_tles(tuple(norads))]
 
-                    # Prepare data for display
-                    pass_data = []
-                    for i, p in enumerate(passes, 1):
-                        duration = p.end - p.start
-                        duration_min = duration.total_seconds() / 60
-                        now = dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
-                        time_until = p.start - now
-                        hours_until = time_until.total_seconds() / 3600
-
-                        pass_data.append({
-                            "Pass #": i,
-                            "Start (UTC)": p.start.strftime("%Y-%m-%d %H:%M"),
-                            "Peak (UTC)": p.peak.strftime("%Y-%m-%d %H:%M"),
-                            "End (UTC)": p.end.strftime("%Y-%m-%d %H:%M"),
-                            "Max Elev (°)": round(p.max_elevation_deg, 1),
-                            "Duration (min)": round(duration_min, 1),
-                            "Hours Until": round(hours_until, 1) if hours_until > 0 else "In Progress"
-                        })
-
-                    df = pd.DataFrame(pass_data)
-
-                    # Display table with custom styling
-                    st.dataframe(
-                        df,
-                        use_container_width=True,
-                        column_config={
-                            "Pass #": st.column_config.NumberColumn("Pass #", width="small"),
-                            "Max Elev (°)": st.column_config.NumberColumn(
-                                "Max Elev (°)",
-                                help="Maximum elevation angle during pass"
-                            ),
-                            "Duration (min)": st.column_config.NumberColumn(
-                                "Duration (min)",
-                                help="Total pass duration in minutes"
-                            ),
-                            "Hours Until": st.column_config.TextColumn(
-                                "Hours Until",
-                                help="Time until pass starts"
-                            )
-                        }
-                    )
+                # One SatrecArray propagation covers every satellite on a shared time grid
+                start_time = time.perf_counter()
+                site = get_site(round(lat, 4), round(lon, 4), round(alt, 1))
+                batch = compute_passes_batch(sats, site, hours_ahead, min_elev)
+                computation_time = time.perf_counter() - start_time
+
+                counts = [len(arrays) for arrays in batch]
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Satellites", len(sats))
+                with col2:
+                    st.metric("Total Passes", sum(counts))
+                with col3:
+                    st.metric("Computation Time", f"{computation_time:.2f}s")
 
-                    # Export functionality
-                    csv_data = df.to_csv(index=False)
+                if sum(counts):
+                    st.markdown("#### 📋 Pass Schedule")
+                    arrays = PassArrays.concatenate(batch)
+                    order = np.argsort(arrays.starts, kind="stable")
+                    df = pd.DataFrame({
+                        "Satellite": np.repeat([sat.name for sat in sats], counts)[order],
+                        "Start (UTC)": pd.DatetimeIndex(arrays.starts[order]).strftime("%Y-%m-%d %H:%M"),
+                        "Peak (UTC)": pd.DatetimeIndex(arrays.peaks[order]).strftime("%Y-%m-%d %H:%M"),
+                        "End (UTC)": pd.DatetimeIndex(arrays.ends[order]).strftime("%Y-%m-%d %H:%M"),
+                        "Max Elev (°)": np.round(arrays.max_elevation_deg[order], 1),
+                        "Duration (min)": np.round((arrays.ends - arrays.starts)[order] / np.timedelta64(60, "s"), 1)
+                    })
+                    st.dataframe(df, use_container_width=True, hide_index=True)
                     st.download_button(
                         label="📥 Download Pass Data (CSV)",
-                        data=csv_data,
-                        file_name=f"{name.replace(' ', '_')}_passes.csv",
+                        data=to_csv_bytes(df),
+                        file_name="multi_satellite_passes.csv",
                         mime="text/csv",
-                        key="download-csv"
-                    )
-
-                    # Visualization
-                    st.markdown("#### 📊 Pass Visualization")
-
-                    # Elevation profile chart
-                    fig = go.Figure()
-                    for i, p in enumerate(passes):
-                        fig.add_trace(go.Scatter(
-                            x=[p.start, p.peak, p.end],
-                            y=[0, p.max_elevation_deg, 0],
-                            mode='lines+markers',
-                            name=f'Pass {i+1}',
-                            line={"width": 2},
-                            marker={"size": 6}
-                        ))
-
-                    fig.update_layout(
-                        title="Satellite Pass Elevation Profiles",
-                        xaxis_title="Time (UTC)",
-                        yaxis_title="Elevation (°)",
-                        showlegend=True,
-                        height=400
+                        key="download-csv-batch"
                     )
-                    st.plotly_chart(fig, use_container_width=True)
-
                 else:
                     st.warning("No satellite passes found in the selected time window.")
-                    st.markdown("""
-                    **💡 Suggestions to find more passes:**
-                    - Reduce the minimum elevation angle
-                    - Increase the search time window
-                    - Try a different satellite
-                    - Verify the satellite is currently operational
-                    """)
 
             except Exception as e:
                 st.error(f"❌ Error during computation: {str(e)}")
                 st.info("Please check your inputs and try again.")
 
+    elif predict_btn and norads:
+        import plotly.graph_objects as go
+
+        try:
+            # Status container stays visible once complete, so no pause is needed to show it
+            with st.status("⚡ Fetching TLE data and computing pass predictions...") as status:
+                start_time = time.perf_counter()
+                name, arrays = cached_passes(
+                    norads[0], round(lat, 4), round(lon, 4), round(alt, 1), hours_ahead, min_elev,
+                    int(time.time() // PASS_CACHE_S)
+                )
+                computation_time = time.perf_counter() - start_time
+                status.update(label="✅ Computation completed!", state="complete")
+
+            # Results Section
+            if len(arrays):
+                st.success(f"Found {len(arrays)} satellite passes for {name}")
+
+                # The columnar passes feed the metrics, table and chart
+                duration_min = (arrays.ends - arrays.starts) / np.timedelta64(60, "s")
+
+                # Summary Metrics
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Total Passes", len(arrays))
+                with col2:
+                    avg_elev = float(arrays.max_elevation_deg.mean())
+                    st.metric("Avg Max Elevation", f"{avg_elev:.1f}°")
+                with col3:
+                    total_duration = float(duration_min.sum())
+                    st.metric("Total Duration", f"{total_duration:.1f} min")
+                with col4:
+                    st.metric("Computation Time", f"{computation_time:.2f}s")
+
+                # Enhanced Results Table
+                st.markdown("#### 📋 Pass Schedule")
+
+                # Build the table column-wise from arrays instead of one dict per pass
+                now = np.datetime64(dt.datetime.now(dt.timezone.utc).replace(tzinfo=None), "s")
+                hours_until = (arrays.starts - now) / np.timedelta64(3600, "s")
+
+                df = pd.DataFrame({
+                    "Pass #": np.arange(1, len(arrays) + 1),
+                    "Start (UTC)": pd.DatetimeIndex(arrays.starts).strftime("%Y-%m-%d %H:%M"),
+                    "Peak (UTC)": pd.DatetimeIndex(arrays.peaks).strftime("%Y-%m-%d %H:%M"),
+                    "End (UTC)": pd.DatetimeIndex(arrays.ends).strftime("%Y-%m-%d %H:%M"),
+                    "Max Elev (°)": np.round(arrays.max_elevation_deg, 1),
+                    "Duration (min)": np.round(duration_min, 1),
+                    "Hours Until": np.where(hours_until > 0, np.round(hours_until, 1).astype(str), "In Progress")
+                })
+
+                # Display table with custom styling
+                st.dataframe(
+                    df,
+                    use_container_width=True,
+                    column_config={
+                        "Pass #": st.column_config.NumberColumn("Pass #", width="small"),
+                        "Max Elev (°)": st.column_config.NumberColumn(
+                            "Max Elev (°)",
+                            help="Maximum elevation angle during pass"
+                        ),
+                        "Duration (min)": st.column_config.NumberColumn(
+                            "Duration (min)",
+                            help="Total pass duration in minutes"
+                        ),
+                        "Hours Until": st.column_config.TextColumn(
+                            "Hours Until",
+                            help="Time until pass starts"
+                        )
+                    }
+                )
+
+                # Export functionality
+                csv_data = to_csv_bytes(df)
+                st.download_button(
+                    label="📥 Download Pass Data (CSV)",
+                    data=csv_data,
+                    file_name=f"{name.replace(' ', '_')}_passes.csv",
+                    mime="text/csv",
+                    key="download-csv"
+                )
+
+                # Visualization
+                st.markdown("#### 📊 Pass Visualization")
+
+                # Elevation profile chart: one WebGL trace, a NaN point after each pass breaks the line
+                # Trace and layout go in as one dict, validated once; marker_color keeps passes distinguishable
+                zeros = np.zeros(len(arrays))
+                pass_numbers = np.repeat(np.arange(1, len(arrays) + 1), 4)
+                fig = go.Figure({
+                    "data": [{
+                        "type": "scattergl",
+                        "x": np.column_stack((arrays.starts, arrays.peaks, arrays.ends, arrays.ends)).ravel(),
+                        "y": np.column_stack((zeros, arrays.max_elevation_deg, zeros, np.full(len(arrays), np.nan))).ravel(),
+                        "customdata": pass_numbers,
+                        "hovertemplate": "Pass %{customdata}<br>%{x|%H:%M} UTC<br>%{y:.1f}°<extra></extra>",
+                        "mode": "lines+markers",
+                        "connectgaps": False,
+                        "line": {"width": 2},
+                        "marker": {"size": 6, "color": pass_numbers, "colorscale": "Turbo"}
+                    }],
+                    "layout": {
+                        "title": {"text": "Satellite Pass Elevation Profiles"},
+                        "xaxis": {"title": {"text": "Time (UTC)"}},
+                        "yaxis": {"title": {"text": "Elevation (°)"}},
+                        "showlegend": False,
+                        "height": 400
+                    }
+                })
+                st.plotly_chart(fig, use_container_width=True)
+
+            else:
+                st.warning("No satellite passes found in the selected time window.")
+                st.markdown("""
+                **💡 Suggestions to find more passes:**
+                - Reduce the minimum elevation angle
+                - Increase the search time window
+                - Try a different satellite
+                - Verify the satellite is currently operational
+                """)
+
+        except Exception as e:
+            st.error(f"❌ Error during computation: {str(e)}")
+            st.info("Please check your inputs and try again.")
+
 elif menu_options[selected_menu] == "visualizer":
     st.markdown("### 🗺️ Advanced Ground Track Visualizer")
     st.markdown("Visualize satellite orbital paths and ground tracks with interactive maps and 3D visualization")
 
-    # Enhanced controls
-    with st.container():
+    # Satellite choice stays outside the form so picking "Custom NORAD ID" reveals its input at once
+    st.markdown("#### 🛰️ Satellite Selection")
+    selected_viz_sat = st.selectbox(
+        "Choose Satellite",
+        options=SATELLITE_LABELS,
+        index=0,
+        key="viz_satellite"
+    )
+
+    # Enhanced controls: widgets inside the form only rerun the script when it is submitted
+    with st.form("visualizer_form", clear_on_submit=False, border=False):
         st.markdown('<div class="control-panel">', unsafe_allow_html=True)
 
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("#### 🛰️ Satellite Selection")
-            viz_satellite_options = {
-                "International Space Station (ISS)": 25544,
-                "Hubble Space Telescope": 20580,
-                "Starlink-1007": 44713,
-                "NOAA-18": 28654,
-                "Terra (EOS AM-1)": 25994,
-                "Custom NORAD ID": None
-            }
-
-            selected_viz_sat = st.selectbox(
-                "Choose Satellite",
-                options=list(viz_satellite_options.keys()),
-                index=0,
-                key="viz_satellite"
-            )
-
-            if viz_satellite_options[selected_viz_sat] is None:
+            if SATELLITE_NORADS[selected_viz_sat] is None:
                 viz_norad = st.number_input(
                     "NORAD Catalog ID",
                     value=25544,
@@ -548,7 +709,7 @@ elif menu_options[selected_menu] == "visualizer":
                     key="viz_norad"
                 )
             else:
-                viz_norad = viz_satellite_options[selected_viz_sat]
+                viz_norad = SATELLITE_NORADS[selected_viz_sat]
                 st.info(f"📡 NORAD ID: {viz_norad}")
 
         with col2:
@@ -578,194 +739,164 @@ elif menu_options[selected_menu] == "visualizer":
 
         st.markdown('</div>', unsafe_allow_html=True)
 
-    # Generate Visualization Button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        viz_btn = st.button(
-            "🗺️ Generate Ground Track",
-            type="primary",
-            use_container_width=True
-        )
+        # Generate Visualization Button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            viz_btn = st.form_submit_button(
+                "🗺️ Generate Ground Track",
+                type="primary",
+                use_container_width=True
+            )
 
     if viz_btn:
-        with st.spinner("🔄 Computing orbital trajectory..."):
-            try:
-                # Progress tracking
-                progress_bar = st.progress(0)
-                status_text = st.empty()
+        import plotly.graph_objects as go
 
-                status_text.text("📡 Fetching satellite data...")
-                progress_bar.progress(20)
-                name, l1, l2 = fetch_tle_cached(int(viz_norad))
+        from src.orbits.pass_predictor import ground_track
 
-                status_text.text("🛰️ Computing orbital path...")
-                progress_bar.progress(50)
-                ts = load.timescale()
-                sat = EarthSatellite(l1, l2, name, ts)
+        try:
+            # Status container stays visible once complete, so no pause is needed to show it
+            with st.status("📡 Fetching satellite data...") as status:
+                name, l1, l2 = get_tle(int(viz_norad))
+
+                status.update(label="🛰️ Computing orbital path...")
+                sat = get_sat(l1, l2, name)
 
                 # Generate track points
-                t0 = ts.now()
-                times = ts.linspace(t0, t0 + dt.timedelta(hours=track_hours), track_resolution)
-
-                # Compute positions
-                lats, lons, alts, timestamps = [], [], [], []
-                for i, t in enumerate(times):
-                    geocentric = sat.at(t)
-                    subpoint = wgs84.subpoint(geocentric)
-                    lats.append(subpoint.latitude.degrees)
-                    lons.append(subpoint.longitude.degrees)
-                    alts.append(subpoint.elevation.m / 1000)  # Convert to km
-                    timestamps.append(t.utc_datetime().replace(tzinfo=None))
-
-                    if (i + 1) % 20 == 0:
-                        progress_bar.progress(50 + int(40 * (i + 1) / track_resolution))
-
-                progress_bar.progress(100)
-                status_text.text("✅ Track computation completed!")
-                time.sleep(0.5)
-                progress_bar.empty()
-                status_text.empty()
-
-                # Results Section
-                st.success(f"Generated {track_resolution} track points for {name}")
-
-                # Summary statistics
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Track Duration", f"{track_hours} hours")
-                with col2:
-                    avg_alt = sum(alts) / len(alts)
-                    st.metric("Avg Altitude", f"{avg_alt:.1f} km")
-                with col3:
-                    max_lat = max(lats)
-                    min_lat = min(lats)
-                    st.metric("Latitude Range", f"{min_lat:.1f}° to {max_lat:.1f}°")
-                with col4:
-                    max_lon = max(lons)
-                    min_lon = min(lons)
-                    st.metric("Longitude Range", f"{min_lon:.1f}° to {max_lon:.1f}°")
-
-                # Interactive Map Visualization
-                st.markdown("#### 🌍 Interactive Ground Track Map")
-
-                # Create folium map
-                m = folium.Map(
-                    location=[lats[0], lons[0]],
-                    zoom_start=2,
-                    tiles='CartoDB positron'
-                )
+                t0 = dt.datetime.now(dt.timezone.utc)
+                offsets_s = np.linspace(0.0, track_hours * 3600.0, track_resolution)
 
-                # Add ground track
-                track_coords = list(zip(lats, lons))
-                folium.PolyLine(
-                    track_coords,
-                    color="#FF6B6B",
-                    weight=3,
-                    opacity=0.8,
-                    popup="Satellite Ground Track"
-                ).add_to(m)
-
-                # Add start and end markers
-                folium.Marker(
-                    [lats[0], lons[0]],
-                    popup=f"Start: {name}<br>Time: {timestamps[0].strftime('%H:%M UTC')}<br>Alt: {alts[0]:.1f} km",
-                    icon=folium.Icon(color='green', icon='play')
-                ).add_to(m)
-
-                folium.Marker(
-                    [lats[-1], lons[-1]],
-                    popup=f"End: {name}<br>Time: {timestamps[-1].strftime('%H:%M UTC')}<br>Alt: {alts[-1]:.1f} km",
-                    icon=folium.Icon(color='red', icon='stop')
-                ).add_to(m)
-
-                # Add current position if requested
-                if show_realtime:
-                    current_t = ts.now()
-                    current_geocentric = sat.at(current_t)
-                    current_subpoint = wgs84.subpoint(current_geocentric)
-                    folium.Marker(
-                        [current_subpoint.latitude.degrees, current_subpoint.longitude.degrees],
-                        popup=f"Current Position<br>Alt: {current_subpoint.elevation.m/1000:.1f} km",
-                        icon=folium.Icon(color='blue', icon='satellite')
-                    ).add_to(m)
-
-                # Display map
-                st_folium(m, width=None, height=500)
-
-                # Altitude Profile Chart
-                st.markdown("#### 📈 Altitude Profile")
-
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=timestamps,
-                    y=alts,
-                    mode='lines',
-                    name='Altitude',
-                    line={"color": '#4ECDC4', "width": 2},
-                    fill='tozeroy',
-                    fillcolor='rgba(78, 205, 196, 0.3)'
-                ))
-
-                fig.update_layout(
-                    title="Satellite Altitude vs Time",
-                    xaxis_title="Time (UTC)",
-                    yaxis_title="Altitude (km)",
-                    height=300,
-                    showlegend=False
+                # Compute positions in the Earth-fixed frame in one vectorized call, skipping GCRS
+                lats, lons, alts = ground_track(sat, t0, offsets_s)
+                timestamps = pd.DatetimeIndex(
+                    np.datetime64(t0.replace(tzinfo=None), "us") + np.rint(offsets_s * 1e6).astype("timedelta64[us]")
                 )
-                st.plotly_chart(fig, use_container_width=True)
-
-                # 3D Orbital Visualization (simplified)
-                st.markdown("#### 🌐 3D Orbital Path")
-
-                # Create 3D scatter plot
-                fig_3d = go.Figure(data=[go.Scatter3d(
-                    x=lons,
-                    y=lats,
-                    z=alts,
-                    mode='lines',
-                    line={"color": '#FF6B6B', "width": 4},
-                    name='Orbital Path'
-                )])
-
-                fig_3d.update_layout(
-                    title="3D Orbital Trajectory",
-                    scene={
-                        "xaxis_title": 'Longitude (°)',
-                        "yaxis_title": 'Latitude (°)',
-                        "zaxis_title": 'Altitude (km)',
-                        "aspectmode": 'manual',
-                        "aspectratio": {"x": 1, "y": 1, "z": 0.5}
-                    },
-                    height=500
+                status.update(label="✅ Track computation completed!", state="complete")
+
+            # Results Section
+            st.success(f"Generated {track_resolution} track points for {name}")
+
+            # Summary statistics
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Track Duration", f"{track_hours} hours")
+            with col2:
+                avg_alt = float(alts.mean())
+                st.metric("Avg Altitude", f"{avg_alt:.1f} km")
+            with col3:
+                max_lat = float(lats.max())
+                min_lat = float(lats.min())
+                st.metric("Latitude Range", f"{min_lat:.1f}° to {max_lat:.1f}°")
+            with col4:
+                max_lon = float(lons.max())
+                min_lon = float(lons.min())
+                st.metric("Longitude Range", f"{min_lon:.1f}° to {max_lon:.1f}°")
+
+            # Interactive Map Visualization
+            st.markdown("#### 🌍 Interactive Ground Track Map")
+
+            # Popup time labels for every sample, formatted in one vectorized pass
+            time_labels = timestamps.strftime("%H:%M UTC")
+
+            # Current position if requested: reuse the track sample nearest to now instead of propagating again
+            current = None
+            if show_realtime:
+                elapsed_s = (dt.datetime.now(dt.timezone.utc) - t0).total_seconds()
+                i_now = int(np.abs(offsets_s - elapsed_s).argmin())
+                current = (float(lats[i_now]), float(lons[i_now]), float(alts[i_now]))
+
+            # Display the map from cached HTML; no click events are read back, so st_folium isn't needed
+            # Split at the antimeridian so Leaflet doesn't draw a line across the map,
+            # then drop vertices that lie within 0.05° of the simplified path
+            segments = []
+            for seg_lats, seg_lons in split_antimeridian(lats, lons):
+                keep = simplify_polyline(seg_lons, seg_lats, 0.05)
+                segments.append(np.column_stack((seg_lats[keep], seg_lons[keep])).tolist())
+            map_html = build_map_html(
+                segments,
+                f"Start: {name}<br>Time: {time_labels[0]}<br>Alt: {alts[0]:.1f} km",
+                f"End: {name}<br>Time: {time_labels[-1]}<br>Alt: {alts[-1]:.1f} km",
+                current
+            )
+            components.html(map_html, height=500)
+
+            # Altitude Profile Chart
+            st.markdown("#### 📈 Altitude Profile")
+
+            fig = go.Figure({
+                "data": [{
+                    "type": "scattergl",
+                    "x": timestamps,
+                    "y": alts,
+                    "mode": "lines",
+                    "name": "Altitude",
+                    "line": {"color": '#4ECDC4', "width": 2},
+                    "fill": "tozeroy",
+                    "fillcolor": "rgba(78, 205, 196, 0.3)"
+                }],
+                "layout": {
+                    "title": {"text": "Satellite Altitude vs Time"},
+                    "xaxis": {"title": {"text": "Time (UTC)"}},
+                    "yaxis": {"title": {"text": "Altitude (km)"}},
+                    "height": 300,
+                    "showlegend": False,
+                    "uirevision": "track"
+                }
+            })
+            st.plotly_chart(fig, use_container_width=True)
+
+            # 3D Orbital Visualization (simplified)
+            st.markdown("#### 🌐 3D Orbital Path")
+
+            # Create 3D scatter plot, striding long tracks down to ~300 WebGL vertices
+            step = max(1, len(lons) // 300)
+            fig_3d = go.Figure(data=[go.Scatter3d(
+                x=lons[::step],
+                y=lats[::step],
+                z=alts[::step],
+                mode='lines',
+                line={"color": '#FF6B6B', "width": 4},
+                name='Orbital Path'
+            )])
+
+            fig_3d.update_layout(
+                title="3D Orbital Trajectory",
+                scene={
+                    "xaxis_title": 'Longitude (°)',
+                    "yaxis_title": 'Latitude (°)',
+                    "zaxis_title": 'Altitude (km)',
+                    "aspectmode": 'manual',
+                    "aspectratio": {"x": 1, "y": 1, "z": 0.5}
+                },
+                height=500,
+                uirevision="track"
+            )
+            st.plotly_chart(fig_3d, use_container_width=True)
+
+            # Export options
+            st.markdown("#### 💾 Export Data")
+            col1, col2 = st.columns(2)
+            with col1:
+                track_df = pd.DataFrame({
+                    'Timestamp': timestamps,
+                    'Latitude': lats,
+                    'Longitude': lons,
+                    'Altitude_km': alts
+                })
+                csv_track = to_csv_bytes(track_df)
+                st.download_button(
+                    label="📥 Download Track Data (CSV)",
+                    data=csv_track,
+                    file_name=f"{name.replace(' ', '_')}_ground_track.csv",
+                    mime="text/csv",
+                    key="download-track"
                 )
-                st.plotly_chart(fig_3d, use_container_width=True)
-
-                # Export options
-                st.markdown("#### 💾 Export Data")
-                col1, col2 = st.columns(2)
-                with col1:
-                    track_df = pd.DataFrame({
-                        'Timestamp': timestamps,
-                        'Latitude': lats,
-                        'Longitude': lons,
-                        'Altitude_km': alts
-                    })
-                    csv_track = track_df.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download Track Data (CSV)",
-                        data=csv_track,
-                        file_name=f"{name.replace(' ', '_')}_ground_track.csv",
-                        mime="text/csv",
-                        key="download-track"
-                    )
-                with col2:
-                    if st.button("🔄 Recalculate with Different Settings"):
-                        st.rerun()
+            with col2:
+                if st.button("🔄 Recalculate with Different Settings"):
+                    st.rerun()
 
-            except Exception as e:
-                st.error(f"❌ Error generating visualization: {str(e)}")
-                st.info("Please check your inputs and try again.")
+        except Exception as e:
+            st.error(f"❌ Error generating visualization: {str(e)}")
+            st.info("Please check your inputs and try again.")
 
 elif menu_options[selected_menu] == "database":
     st.markdown("### 📊 Satellite Database Explorer")
@@ -813,89 +944,35 @@ elif menu_options[selected_menu] == "database":
 
         st.markdown('</div>', unsafe_allow_html=True)
 
-    # Load satellite database (simplified - in real app, this would fetch from Celestrak)
-    if 'satellite_db' not in st.session_state:
-        with st.spinner("Loading satellite database..."):
-            # This is a simplified example - real implementation would fetch from Celestrak
-            st.session_state.satellite_db = [
-                {"norad": 25544, "name": "ISS (ZARYA)", "category": "Science", "active": True, "launch_date": "1998-11-20"},
-                {"norad": 20580, "name": "HST", "category": "Science", "active": True, "launch_date": "1990-04-24"},
-                {"norad": 44713, "name": "STARLINK-1007", "category": "Communications", "active": True, "launch_date": "2019-11-11"},
-                {"norad": 28654, "name": "NOAA 18", "category": "Weather", "active": True, "launch_date": "2005-05-20"},
-                {"norad": 25994, "name": "TERRA", "category": "Earth Observation", "active": True, "launch_date": "1999-12-18"},
-                {"norad": 40069, "name": "METEOR-M2", "category": "Weather", "active": True, "launch_date": "2014-07-08"},
-                {"norad": 41866, "name": "IRNSS-1I", "category": "Navigation", "active": True, "launch_date": "2018-04-12"},
-                {"norad": 43013, "name": "GSAT-11", "category": "Communications", "active": True, "launch_date": "2018-12-19"},
-            ]
-
-    db = st.session_state.satellite_db
-
-    # Apply filters
-    filtered_db = db.copy()
-
-    if search_term:
-        filtered_db = [sat for sat in filtered_db if
-                      search_term.lower() in sat['name'].lower() or
-                      search_term in str(sat['norad'])]
-
-    if category_filter != "All":
-        category_map = {
-            "Weather": ["NOAA", "METEOR"],
-            "Communications": ["STARLINK", "GSAT", "IRNSS"],
-            "Navigation": ["IRNSS"],
-            "Earth Observation": ["TERRA"],
-            "Science": ["ISS", "HST"],
-            "Military": []
-        }
-        filtered_db = [sat for sat in filtered_db if
-                      any(keyword in sat['name'] for keyword in category_map.get(category_filter, []))]
-
-    if show_active_only:
-        filtered_db = [sat for sat in filtered_db if sat['active']]
-
-    # Sort results
-    if sort_by == "Name":
-        filtered_db.sort(key=lambda x: x['name'])
-    elif sort_by == "NORAD ID":
-        filtered_db.sort(key=lambda x: x['norad'])
-    elif sort_by == "Launch Date":
-        filtered_db.sort(key=lambda x: x['launch_date'], reverse=True)
+    filtered_db = filter_satellite_db(search_term, category_filter, show_active_only, sort_by)
 
     # Display statistics
     if show_stats:
+        db_stats = satellite_db_stats()
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Satellites", len(db))
+            st.metric("Total Satellites", db_stats["total"])
         with col2:
-            active_count = sum(1 for sat in db if sat['active'])
-            st.metric("Active Satellites", active_count)
+            st.metric("Active Satellites", db_stats["active"])
         with col3:
             st.metric("Filtered Results", len(filtered_db))
         with col4:
-            categories = {}
-            for sat in db:
-                cat = sat['category']
-                categories[cat] = categories.get(cat, 0) + 1
-            most_common = max(categories.items(), key=lambda x: x[1])
-            st.metric("Top Category", f"{most_common[0]} ({most_common[1]})")
+            st.metric("Top Category", f"{db_stats['top_category']} ({db_stats['top_category_count']})")
+        st.bar_chart(db_stats["category_counts"], height=200, x_label="Category", y_label="Satellites")
 
     # Display satellite list
     st.markdown(f"#### 🛰️ Satellite Catalog ({len(filtered_db)} results)")
 
-    if filtered_db:
-        # Create display dataframe
-        display_data = []
-        for sat in filtered_db:
-            display_data.append({
-                "NORAD ID": sat['norad'],
-                "Name": sat['name'],
-                "Category": sat['category'],
-                "Status": "🟢 Active" if sat['active'] else "🔴 Inactive",
-                "Launch Date": sat['launch_date'],
-                "Actions": ""
-            })
-
-        df_display = pd.DataFrame(display_data)
+    if not filtered_db.empty:
+        # Create display dataframe straight from the filtered columns
+        df_display = pd.DataFrame({
+            "NORAD ID": filtered_db["norad"],
+            "Name": filtered_db["name"],
+            "Category": filtered_db["category"],
+            "Status": np.where(filtered_db["active"], "🟢 Active", "🔴 Inactive"),
+            "Launch Date": filtered_db["launch_date"],
+            "Actions": ""
+        })
 
         # Display with custom formatting
         st.dataframe(
@@ -914,19 +991,27 @@ elif menu_options[selected_menu] == "database":
 
         # Action buttons for each satellite
         st.markdown("#### 🎯 Quick Actions")
-        cols = st.columns(4)
-        selected_satellites = []
-
-        for i, sat in enumerate(filtered_db[:8]):  # Show first 8
-            with cols[i % 4]:
-                if st.button(f"📊 Predict {sat['name'][:15]}...", key=f"predict_{sat['norad']}", use_container_width=True):
-                    st.session_state.selected_satellite = sat['norad']
-                    st.session_state.selected_menu = "tracker"
-                    st.rerun()
-                if st.button(f"🗺️ Track {sat['name'][:15]}...", key=f"track_{sat['norad']}", use_container_width=True):
-                    st.session_state.selected_satellite = sat['norad']
-                    st.session_state.selected_menu = "visualizer"
-                    st.rerun()
+        # One picker plus two buttons instead of a predict/track button pair per satellite
+        quick_names = dict(zip(filtered_db["norad"].tolist(), filtered_db["name"].tolist()))
+        col_pick, col_predict, col_track = st.columns([2, 1, 1])
+        with col_pick:
+            quick_norad = st.selectbox(
+                "Satellite",
+                options=tuple(quick_names),
+                format_func=quick_names.get,
+                key="quick_action_satellite",
+                label_visibility="collapsed"
+            )
+        with col_predict:
+            if st.button("📊 Predict Passes", key="quick_predict", use_container_width=True):
+                st.session_state.selected_satellite = quick_norad
+                st.session_state.selected_menu = "tracker"
+                st.rerun()
+        with col_track:
+            if st.button("🗺️ Track", key="quick_track", use_container_width=True):
+                st.session_state.selected_satellite = quick_norad
+                st.session_state.selected_menu = "visualizer"
+                st.rerun()
 
         # Bulk actions
         st.markdown("---")
@@ -936,10 +1021,9 @@ elif menu_options[selected_menu] == "database":
                 st.info("Batch prediction feature coming soon!")
         with col2:
             if st.button("📥 Export Database"):
-                csv_db = pd.DataFrame(filtered_db).to_csv(index=False)
                 st.download_button(
                     label="Download CSV",
-                    data=csv_db,
+                    data=export_satellite_db(search_term, category_filter, show_active_only, sort_by),
                     file_name="satellite_database.csv",
                     mime="text/csv",
                     key="download-db"
@@ -1023,17 +1107,8 @@ elif menu_options[selected_menu] == "settings":
 
         # Quick location presets
         st.markdown("#### 🌍 Quick Location Presets")
-        preset_locations = {
-            "New Delhi, India": (28.6139, 77.2090, 0),
-            "London, UK": (51.5074, -0.1278, 0),
-            "New York, USA": (40.7128, -74.0060, 0),
-            "Tokyo, Japan": (35.6762, 139.6503, 0),
-            "Sydney, Australia": (-33.8688, 151.2093, 0),
-            "Cape Canaveral, USA": (28.5384, -80.6479, 0)
-        }
-
         cols = st.columns(2)
-        for i, (name, (lat, lon, alt)) in enumerate(preset_locations.items()):
+        for i, (name, lat, lon, alt) in enumerate(LOCATION_PRESETS):
             with cols[i % 2]:
                 if st.button(f"📍 {name}", key=f"preset_{i}"):
                     st.session_state.default_location = {
@@ -1183,7 +1258,6 @@ elif menu_options[selected_menu] == "settings":
                     "appearance": st.session_state.get("appearance_settings", {}),
                     "advanced": st.session_state.get("advanced_settings", {})
                 }
-                import json
                 settings_json = json.dumps(settings_data, indent=2)
                 st.download_button(
                     label="Download Settings JSON",
@@ -1238,18 +1312,7 @@ elif menu_options[selected_menu] == "about":
     # Technical stack
     st.markdown("#### 🛠️ Technical Stack")
     tech_cols = st.columns(4)
-    technologies = [
-        ("Python", "Core programming language"),
-        ("Skyfield", "Orbital mechanics library"),
-        ("Streamlit", "Web application framework"),
-        ("Plotly", "Interactive visualizations"),
-        ("Folium", "Interactive maps"),
-        ("NumPy", "Numerical computations"),
-        ("Pandas", "Data manipulation"),
-        ("Requests", "HTTP client")
-    ]
-
-    for i, (tech, desc) in enumerate(technologies):
+    for i, (tech, desc) in enumerate(TECH_STACK):
         with tech_cols[i % 4]:
             st.markdown(f"**{tech}**")
             st.caption(desc)
@@ -1257,18 +1320,7 @@ elif menu_options[selected_menu] == "about":
     # Features showcase
     st.markdown("#### ✨ Key Features")
     feature_cols = st.columns(2)
-    features = [
-        ("🛰️ Real-Time Tracking", "Live satellite position monitoring"),
-        ("📊 Advanced Predictions", "High-precision pass calculations"),
-        ("🗺️ Orbital Visualization", "Interactive 2D/3D trajectory maps"),
-        ("📡 TLE Integration", "Direct Celestrak database access"),
-        ("⚡ Performance Optimized", "Vectorized computations and caching"),
-        ("📱 Responsive Design", "Works on desktop and mobile devices"),
-        ("💾 Data Export", "CSV/JSON export capabilities"),
-        ("🔬 Scientific Accuracy", "Research-grade orbital calculations")
-    ]
-
-    for i, (feature, desc) in enumerate(features):
+    for i, (feature, desc) in enumerate(KEY_FEATURES):
         with feature_cols[i % 2]:
             st.markdown(f"**{feature}**: {desc}")
 
@@ -1,14 +1,167 @@
 import datetime as dt
+import threading
 import time
-from typing import List, Optional
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-from skyfield.api import EarthSatellite, load, wgs84
 
-from src.orbits.pass_predictor_optimized import compute_passes_optimized, fetch_tle_cached, PassEvent
+from src.orbits._kernels import pass_quality
+
+# Skyfield and the src.orbits modules that pull it in are imported inside the cached
+# factories and the prediction branch, so reruns that only move widgets don't touch them.
+
+# Presets for the satellite picker; None means "enter an ID"
+SATELLITE_PRESETS = {
+    "🌍 ISS (International Space Station)": 25544,
+    "🔭 Hubble Space Telescope": 20580,
+    "📡 Starlink-1007": 44713,
+    "🌦️ NOAA-18 (Weather)": 28654,
+    "🛰️ TERRA (Earth Observation)": 25994,
+    "🛰️ AQUA (Earth Observation)": 27424,
+    "🛰️ SUOMI NPP": 37849,
+    "🛰️ Landsat 8": 39084,
+    "🛰️ Sentinel-2A": 40697,
+    "🛰️ Custom NORAD ID": None
+}
+
+# Sidebar settings of the ISS demo, which are also the defaults on a first visit
+DEMO_INPUTS = {
+    "lat": 28.6139,
+    "lon": 77.2090,
+    "hours": 24,
+    "min_elev": 10,
+    "satellites": [next(iter(SATELLITE_PRESETS))],
+}
+
+# Peak-elevation bin edges (°) and the visibility rating of each bin, lowest first
+VISIBILITY_EDGES = (20, 40, 60)
+VISIBILITY_LABELS = ("❌ Poor", "⚠️ Fair", "✅ Good", "🌟 Excellent")
+
+# Column display settings for the pass schedule table
+PASS_COLUMN_CONFIG = {
+    "#": st.column_config.NumberColumn("Pass #", width="small"),
+    "Max Elev (°)": st.column_config.NumberColumn(
+        "Max Elev (°)",
+        help="Maximum elevation angle - higher is better visibility",
+        format="%.1f°"
+    ),
+    "Duration (min)": st.column_config.NumberColumn(
+        "Duration (min)",
+        help="Total pass duration",
+        format="%.1f"
+    ),
+    "Hours Until": st.column_config.NumberColumn(
+        "Time Until",
+        help="Hours until pass starts; blank once the pass has begun",
+        format="%.1f h"
+    ),
+    "Live": st.column_config.CheckboxColumn(
+        "🔴 Live",
+        help="Pass is in progress or already started"
+    ),
+    "Visibility": st.column_config.TextColumn(
+        "Visibility Rating",
+        help="Expected visibility quality"
+    ),
+    "Quality Score": st.column_config.ProgressColumn(
+        "Quality Score",
+        help="Overall pass quality (0-100)",
+        format="%.0f",
+        min_value=0,
+        max_value=100
+    )
+}
+
+
+def utc_minutes(times: np.ndarray) -> np.ndarray:
+    """Format datetime64 times as "YYYY-MM-DD HH:MM" strings in one vectorized call."""
+    return np.char.replace(np.datetime_as_string(times, unit="m"), "T", " ")
+
+
+def load_iss_demo():
+    """Demo button callback: write the demo settings into the sidebar widgets before the rerun."""
+    st.session_state.update(DEMO_INPUTS)
+
+
+@st.cache_resource
+def get_timescale():
+    """Build the Skyfield timescale once per process from its bundled tables."""
+    from skyfield.api import load
+
+    return load.timescale(builtin=True)
+
+
+@st.cache_data(ttl=7200, show_spinner=False)
+def get_tle(norad: int):
+    """Fetch a TLE at most once per two hours per NORAD ID, shared by every session.
+
+    Misses go through the predictor's on-disk store, which the welcome-screen prefetch warms.
+    """
+    from src.orbits.pass_predictor import fetch_tle
+
+    return fetch_tle(norad)
+
+
+@st.cache_data(ttl=7200, show_spinner=False)
+def get_tles(norads: tuple):
+    """Fetch several TLEs concurrently; cached per ID tuple like ``get_tle``."""
+    from src.orbits.pass_predictor import fetch_tles
+
+    return fetch_tles(norads)
+
+
+@st.cache_resource
+def prefetch_tles(norads: tuple) -> threading.Thread:
+    """Warm the on-disk TLE store for ``norads`` in a background thread, once per process.
+
+    The predictor (and Skyfield with it) is imported inside the thread, so the welcome
+    screen's script run doesn't pay for it. Errors are ignored here: a failed prefetch
+    just leaves the click to fetch, and report, as before.
+    """
+
+    def warm():
+        try:
+            from src.orbits.pass_predictor import fetch_tles
+
+            fetch_tles(norads)
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=warm, name="tle-prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_resource
+def get_satellite(l1: str, l2: str, name: str):
+    """Build the SGP4 model once per TLE; a refreshed TLE gets a new cache key."""
+    from skyfield.api import EarthSatellite
+
+    return EarthSatellite(l1, l2, name, get_timescale())
+
+
+@st.cache_resource
+def load_css() -> str:
+    """Read the app stylesheet once per process, already wrapped in its <style> tag."""
+    css = (Path(__file__).parent / "static" / "styles_optimized.css").read_text(encoding="utf-8")
+    return f"<style>{css}</style>"
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_passes(l1: str, l2: str, name: str, lat: float, lon: float, alt_m: float,
+                  hours: int, min_elev: float):
+    """Memoize a single-satellite prediction for ten minutes, keyed on the TLE so a refresh recomputes.
+
+    Uses the same predictor as the multi-satellite batch and returns the passes column-wise
+    as :class:`PassArrays`, the form every results view reads.
+    """
+    from src.orbits.pass_predictor import compute_pass_arrays, observer_site
+
+    site = observer_site(lat, lon, alt_m)
+    return compute_pass_arrays(get_satellite(l1, l2, name), site, hours, min_elev)
+
 
 # Modern page config with dark theme
 st.set_page_config(
@@ -18,470 +171,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Ultra-Modern Glassmorphism UI Design
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-
-    * {
-        font-family: 'Inter', sans-serif;
-    }
-
-    /* Modern glassmorphism color scheme */
-    :root {
-        --glass-bg: rgba(255, 255, 255, 0.1);
-        --glass-border: rgba(255, 255, 255, 0.2);
-        --glass-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        --gradient-primary: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        --gradient-secondary: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        --gradient-accent: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        --text-primary: #ffffff;
-        --text-secondary: rgba(255, 255, 255, 0.8);
-        --blur-bg: rgba(0, 0, 0, 0.3);
-        --card-bg: rgba(255, 255, 255, 0.05);
-        --card-border: rgba(255, 255, 255, 0.1);
-    }
-
-    /* Animated gradient background */
-    .glass-bg {
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background:
-            radial-gradient(circle at 20% 50%, rgba(120, 119, 198, 0.3) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 119, 198, 0.3) 0%, transparent 50%),
-            radial-gradient(circle at 40% 80%, rgba(120, 219, 226, 0.3) 0%, transparent 50%),
-            linear-gradient(45deg, #0f0f23 0%, #1a1a2e 25%, #16213e 50%, #0f0f23 75%, #1a1a2e 100%);
-        background-size: 400% 400%;
-        animation: gradientShift 15s ease infinite;
-        z-index: -2;
-    }
-
-    @keyframes gradientShift {
-        0%, 100% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-    }
-
-    /* Floating particles */
-    .particles {
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        pointer-events: none;
-        z-index: -1;
-    }
-
-    .particle {
-        position: absolute;
-        background: rgba(255, 255, 255, 0.1);
-        border-radius: 50%;
-        animation: float 6s ease-in-out infinite;
-    }
-
-    .particle:nth-child(1) { top: 10%; left: 10%; animation-delay: 0s; }
-    .particle:nth-child(2) { top: 20%; left: 80%; animation-delay: 1s; }
-    .particle:nth-child(3) { top: 70%; left: 20%; animation-delay: 2s; }
-    .particle:nth-child(4) { top: 60%; left: 90%; animation-delay: 3s; }
-    .particle:nth-child(5) { top: 30%; left: 50%; animation-delay: 4s; }
-
-    @keyframes float {
-        0%, 100% { transform: translateY(0px) rotate(0deg); opacity: 0.1; }
-        50% { transform: translateY(-20px) rotate(180deg); opacity: 0.3; }
-    }
-
-    .main-header {
-        background: var(--gradient-primary);
-        background-clip: text;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 3.8rem;
-        font-weight: 800;
-        text-align: center;
-        margin-bottom: 1.5rem;
-        animation: headerGlow 2s ease-in-out infinite alternate;
-        text-shadow: 0 0 30px rgba(102, 126, 234, 0.5);
-        letter-spacing: -1px;
-    }
-
-    @keyframes headerGlow {
-        from { filter: drop-shadow(0 0 10px rgba(102, 126, 234, 0.5)); }
-        to { filter: drop-shadow(0 0 20px rgba(102, 126, 234, 0.8)); }
-    }
-
-    .metric-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        -webkit-backdrop-filter: blur(20px);
-        border: 1px solid var(--card-border);
-        border-radius: 20px;
-        padding: 2rem;
-        color: var(--text-primary);
-        text-align: center;
-        box-shadow: var(--glass-shadow);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        animation: cardSlideIn 0.8s ease-out;
-        position: relative;
-        overflow: hidden;
-    }
-
-    .metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);
-        transition: left 0.6s;
-    }
-
-    .metric-card:hover {
-        transform: translateY(-8px) scale(1.02);
-        box-shadow: 0 20px 40px rgba(0, 0, 0, 0.2);
-        border-color: rgba(255, 255, 255, 0.3);
-    }
-
-    .metric-card:hover::before {
-        left: 100%;
-    }
-
-    @keyframes cardSlideIn {
-        from {
-            opacity: 0;
-            transform: translateY(30px) scale(0.9);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0) scale(1);
-        }
-    }
-
-    .sidebar-header {
-        background: var(--gradient-accent);
-        background-clip: text;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 1.6rem;
-        font-weight: 700;
-        text-shadow: 0 0 15px rgba(79, 172, 254, 0.5);
-        letter-spacing: 1px;
-        text-transform: uppercase;
-    }
-
-    .stButton>button {
-        background: var(--gradient-primary);
-        color: var(--text-primary);
-        border: none;
-        border-radius: 15px;
-        padding: 1rem 2.5rem;
-        font-weight: 600;
-        font-size: 1.1rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
-        backdrop-filter: blur(10px);
-        position: relative;
-        overflow: hidden;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-
-    .stButton>button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
-        transition: left 0.5s;
-    }
-
-    .stButton>button:hover {
-        transform: translateY(-3px) scale(1.05);
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.6);
-    }
-
-    .stButton>button:hover::before {
-        left: 100%;
-    }
-
-    .stButton>button:active {
-        transform: translateY(-1px) scale(1.02);
-    }
-
-    .dataframe-container {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        border: 1px solid var(--card-border);
-        border-radius: 15px;
-        padding: 1.5rem;
-        animation: dataFadeIn 1s ease-out;
-        box-shadow: var(--glass-shadow);
-    }
-
-    @keyframes dataFadeIn {
-        from {
-            opacity: 0;
-            transform: scale(0.95) translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: scale(1) translateY(0);
-        }
-    }
-
-    .stProgress > div > div > div > div {
-        background: var(--gradient-primary);
-        border-radius: 8px;
-        animation: progressShimmer 2s ease-in-out infinite;
-        box-shadow: 0 0 10px rgba(102, 126, 234, 0.5);
-    }
-
-    @keyframes progressShimmer {
-        0%, 100% { box-shadow: 0 0 10px rgba(102, 126, 234, 0.5); }
-        50% { box-shadow: 0 0 20px rgba(102, 126, 234, 0.8); }
-    }
-
-    .stInfo, .stSuccess, .stWarning, .stError {
-        background: var(--card-bg) !important;
-        backdrop-filter: blur(20px) !important;
-        border: 1px solid var(--card-border) !important;
-        border-radius: 15px !important;
-        color: var(--text-primary) !important;
-        box-shadow: var(--glass-shadow) !important;
-        animation: alertSlideIn 0.6s ease-out;
-    }
-
-    @keyframes alertSlideIn {
-        from {
-            opacity: 0;
-            transform: translateX(30px) scale(0.9);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0) scale(1);
-        }
-    }
-
-    .stDataFrame {
-        background: var(--card-bg) !important;
-        backdrop-filter: blur(20px) !important;
-        border: 1px solid var(--card-border) !important;
-        border-radius: 15px !important;
-        box-shadow: var(--glass-shadow) !important;
-        animation: tableMorph 0.8s ease-out;
-    }
-
-    .stDataFrame th {
-        background: var(--gradient-primary) !important;
-        color: var(--text-primary) !important;
-        font-weight: 600 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 0.5px !important;
-        font-size: 0.9rem !important;
-        backdrop-filter: blur(10px) !important;
-    }
-
-    .stDataFrame td {
-        color: var(--text-secondary) !important;
-        border-bottom: 1px solid var(--card-border) !important;
-    }
-
-    @keyframes tableMorph {
-        from {
-            opacity: 0;
-            transform: scale(0.9) rotateX(10deg);
-        }
-        to {
-            opacity: 1;
-            transform: scale(1) rotateX(0deg);
-        }
-    }
-
-    .sidebar .sidebar-content {
-        background: var(--card-bg) !important;
-        backdrop-filter: blur(20px) !important;
-        border: 1px solid var(--card-border) !important;
-        border-radius: 20px !important;
-        box-shadow: var(--glass-shadow) !important;
-        animation: sidebarSlideIn 0.8s ease-out;
-    }
-
-    @keyframes sidebarSlideIn {
-        from {
-            opacity: 0;
-            transform: translateX(-30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-
-    .stSelectbox, .stNumberInput, .stSlider, .stTextInput {
-        background: var(--card-bg) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 1px solid var(--card-border) !important;
-        border-radius: 12px !important;
-        color: var(--text-primary) !important;
-        transition: all 0.3s ease;
-    }
-
-    .stSelectbox:hover, .stNumberInput:hover, .stSlider:hover, .stTextInput:hover {
-        border-color: rgba(102, 126, 234, 0.5) !important;
-        box-shadow: 0 0 20px rgba(102, 126, 234, 0.3) !important;
-        transform: translateY(-2px);
-    }
-
-    .stSelectbox:focus, .stNumberInput:focus, .stSlider:focus, .stTextInput:focus {
-        border-color: #667eea !important;
-        box-shadow: 0 0 25px rgba(102, 126, 234, 0.5) !important;
-        transform: translateY(-2px);
-    }
-
-    /* Custom glassmorphism scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-    }
-
-    ::-webkit-scrollbar-track {
-        background: var(--card-bg);
-        border-radius: 10px;
-        backdrop-filter: blur(10px);
-    }
-
-    ::-webkit-scrollbar-thumb {
-        background: var(--gradient-primary);
-        border-radius: 10px;
-        box-shadow: 0 0 10px rgba(102, 126, 234, 0.5);
-    }
-
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--gradient-secondary);
-        box-shadow: 0 0 15px rgba(245, 87, 108, 0.7);
-    }
-
-    /* Section headers with glass effect */
-    .section-header {
-        color: var(--text-primary);
-        font-size: 1.3rem;
-        font-weight: 600;
-        margin: 2rem 0 1rem 0;
-        padding: 1rem;
-        background: var(--card-bg);
-        backdrop-filter: blur(10px);
-        border: 1px solid var(--card-border);
-        border-radius: 12px;
-        box-shadow: var(--glass-shadow);
-        display: flex;
-        align-items: center;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-
-    .section-header::before {
-        content: '⚡';
-        margin-right: 0.75rem;
-        animation: iconGlow 2s ease-in-out infinite alternate;
-    }
-
-    @keyframes iconGlow {
-        from { filter: drop-shadow(0 0 5px rgba(102, 126, 234, 0.5)); }
-        to { filter: drop-shadow(0 0 10px rgba(102, 126, 234, 0.8)); }
-    }
-
-    /* Form labels with neon effect */
-    .form-label {
-        color: var(--text-secondary);
-        font-size: 0.9rem;
-        font-weight: 500;
-        margin-bottom: 0.5rem;
-        display: block;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        text-shadow: 0 0 5px rgba(255, 255, 255, 0.3);
-    }
-
-    /* Info boxes with glass effect */
-    .info-box {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        border: 1px solid var(--card-border);
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: var(--glass-shadow);
-        animation: infoBoxMorph 0.8s ease-out;
-    }
-
-    .info-box h4 {
-        color: var(--text-primary);
-        margin: 0 0 1rem 0;
-        font-size: 1.2rem;
-        font-weight: 600;
-        text-shadow: 0 0 10px rgba(255, 255, 255, 0.5);
-    }
-
-    .info-box p {
-        color: var(--text-secondary);
-        margin: 0;
-        font-size: 1rem;
-        line-height: 1.6;
-    }
-
-    @keyframes infoBoxMorph {
-        from {
-            opacity: 0;
-            transform: scale(0.8) rotateY(10deg);
-        }
-        to {
-            opacity: 1;
-            transform: scale(1) rotateY(0deg);
-        }
-    }
-
-    /* Status indicators with glow */
-    .status-indicator {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        border-radius: 50%;
-        margin-right: 0.5rem;
-        animation: statusPulse 2s ease-in-out infinite;
-        box-shadow: 0 0 10px currentColor;
-    }
-
-    .status-online {
-        background: #00ff00;
-        color: #00ff00;
-    }
-
-    .status-active {
-        background: #667eea;
-        color: #667eea;
-    }
-
-    .status-standby {
-        background: #ffa500;
-        color: #ffa500;
-    }
-
-    @keyframes statusPulse {
-        0%, 100% {
-            opacity: 1;
-            transform: scale(1);
-        }
-        50% {
-            opacity: 0.7;
-            transform: scale(1.2);
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+# Ultra-Modern Glassmorphism UI Design. Streamlit drops elements that a rerun doesn't
+# re-emit, so the <style> tag is sent every run, but it is read and built only once.
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Glassmorphism background with particles
 st.markdown('<div class="glass-bg"></div>', unsafe_allow_html=True)
@@ -499,24 +191,12 @@ st.markdown('''
 st.markdown('<h1 class="main-header">🛰️ Satellite Pass Predictor Pro</h1>', unsafe_allow_html=True)
 st.markdown('<p style="text-align: center; font-size: 1.2rem; color: var(--text-secondary); margin-bottom: 2rem; font-weight: 300;">Advanced Orbital Tracking | Real-Time TLE Data | Neural Predictions</p>', unsafe_allow_html=True)
 
-# Glassmorphism status dashboard
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-online"></span><strong>SYSTEM</strong></div><div style="color: #00ff00; font-weight: 500;">ONLINE</div></div>', unsafe_allow_html=True)
-with col2:
-    st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-active"></span><strong>TLE DATA</strong></div><div style="color: #667eea; font-weight: 500;">SYNCED</div></div>', unsafe_allow_html=True)
-with col3:
-    st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-active"></span><strong>ORBITAL</strong></div><div style="color: #4facfe; font-weight: 500;">ENGAGED</div></div>', unsafe_allow_html=True)
-with col4:
-    st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-standby"></span><strong>STATUS</strong></div><div style="color: #ffa500; font-weight: 500;">STANDBY</div></div>', unsafe_allow_html=True)
-
-# Glassmorphism mission briefing
-st.markdown("""
-<div class="info-box">
-    <h4>🚀 Neural Control Matrix</h4>
-    <p>Advanced orbital prediction algorithms initialized • Real-time TLE database connected • Quantum computing systems ready for satellite trajectory calculations and pass predictions with AI-enhanced accuracy.</p>
-</div>
-""", unsafe_allow_html=True)
+# Status dashboard and mission briefing slot; only the welcome screen fills it
+intro = st.container()
+
+# Widgets below take their defaults from session state so the demo button can set them
+for input_key, default in DEMO_INPUTS.items():
+    st.session_state.setdefault(input_key, default)
 
 # Neural Control Matrix sidebar
 with st.sidebar:
@@ -530,7 +210,7 @@ with st.sidebar:
         st.markdown('<label class="form-label">Latitude (°)</label>', unsafe_allow_html=True)
         lat = st.number_input(
             "Latitude",
-            value=28.6139,
+            key="lat",
             min_value=-90.0,
             max_value=90.0,
             format="%.6f",
@@ -540,7 +220,7 @@ with st.sidebar:
         st.markdown('<label class="form-label">Longitude (°)</label>', unsafe_allow_html=True)
         lon = st.number_input(
             "Longitude",
-            value=77.2090,
+            key="lon",
             min_value=-180.0,
             max_value=180.0,
             format="%.6f",
@@ -564,7 +244,7 @@ with st.sidebar:
         "Search Window",
         min_value=1,
         max_value=72,
-        value=24,
+        key="hours",
         help="How far ahead to predict satellite passes"
     )
 
@@ -573,59 +253,36 @@ with st.sidebar:
         "Minimum Elevation",
         min_value=0,
         max_value=90,
-        value=10,
+        key="min_elev",
         help="Minimum elevation angle for visible passes"
     )
 
     # Orbital target selection matrix
     st.markdown('<div class="section-header">🛰️ Orbital Target Matrix</div>', unsafe_allow_html=True)
 
-    satellite_presets = {
-        "🌍 ISS (International Space Station)": 25544,
-        "🔭 Hubble Space Telescope": 20580,
-        "📡 Starlink-1007": 44713,
-        "🌦️ NOAA-18 (Weather)": 28654,
-        "🛰️ TERRA (Earth Observation)": 25994,
-        "🛰️ AQUA (Earth Observation)": 27424,
-        "🛰️ SUOMI NPP": 37849,
-        "🛰️ Landsat 8": 39084,
-        "🛰️ Sentinel-2A": 40697,
-        "🛰️ Custom NORAD ID": None
-    }
-
-    st.markdown('<label class="form-label">Select Satellite</label>', unsafe_allow_html=True)
-    selected_satellite = st.selectbox(
-        "Select Satellite",
-        options=list(satellite_presets.keys()),
-        index=0,
-        help="Choose from tracked satellites or enter custom NORAD ID"
+    st.markdown('<label class="form-label">Select Satellites</label>', unsafe_allow_html=True)
+    selected_satellites = st.multiselect(
+        "Select Satellites",
+        options=tuple(SATELLITE_PRESETS),
+        key="satellites",
+        help="Pick one satellite for a detailed forecast, or several to compare them in one batch run"
     )
 
-    if satellite_presets[selected_satellite] is None:
+    norads = [SATELLITE_PRESETS[label] for label in selected_satellites if SATELLITE_PRESETS[label] is not None]
+    if any(SATELLITE_PRESETS[label] is None for label in selected_satellites):
         st.markdown('<label class="form-label">NORAD Catalog ID</label>', unsafe_allow_html=True)
-        norad = st.number_input(
+        norads.append(int(st.number_input(
             "NORAD ID",
             value=25544,
             step=1,
             min_value=1,
             help="Enter satellite NORAD catalog number"
-        )
-    else:
-        norad = satellite_presets[selected_satellite]
-        st.info(f"**NORAD ID:** {norad}")
-
-    # Advanced settings in collapsible section
-    with st.expander("⚙️ Advanced Settings", expanded=False):
-        time_step = st.slider(
-            "Time Resolution (min)",
-            min_value=0.1,
-            max_value=2.0,
-            value=0.5,
-            step=0.1,
-            help="Higher precision = slower but more accurate"
-        )
-
-        st.caption("💡 **Pro Tip:** Lower resolution for quick scans, higher for precision tracking")
+        )))
+    # Keep the first occurrence of each ID, in selection order
+    norads = list(dict.fromkeys(norads))
+    if norads:
+        st.info(f"**NORAD ID:** {', '.join(map(str, norads))}")
+    norad = norads[0] if norads else None
 
     # Neural launch sequence
     st.markdown("---")
@@ -639,111 +296,54 @@ with st.sidebar:
             st.markdown("""
             <div style="text-align: center; margin-top: 1rem;">
                 <div style="color: var(--text-secondary); font-size: 0.9rem; margin-bottom: 0.5rem;">SYSTEM STATUS</div>
-                <div style="display: inline-block; padding: 0.5rem 1rem; background: var(--card-bg); backdrop-filter: blur(10px); border: 1px solid var(--card-border); border-radius: 20px; box-shadow: var(--glass-shadow); animation: statusPulse 3s ease-in-out infinite;">
+                <div class="standby-badge">
                     <span style="color: #ffa500;">🔄 STANDBY MODE</span>
                 </div>
             </div>
-            <style>
-            @keyframes statusPulse {
-                0%, 100% { border-color: var(--card-border); box-shadow: var(--glass-shadow); }
-                50% { border-color: rgba(255, 165, 0, 0.5); box-shadow: 0 0 20px rgba(255, 165, 0, 0.3); }
-            }
-            </style>
             """, unsafe_allow_html=True)
 
-    # Real-time status indicator with enhanced animations
-    if go:
-        st.markdown("### 📊 System Status")
-        status_placeholder = st.empty()
-
-        # Animated status messages
-        status_messages = [
-            "🔄 Initializing prediction engine...",
-            "🛰️ Connecting to satellite databases...",
-            "⚡ Optimizing orbital calculations...",
-            "🌟 Preparing stunning visualizations...",
-            "✨ Mission ready for launch!"
-        ]
-
-        for msg in status_messages:
-            status_placeholder.info(msg)
-            time.sleep(0.3)  # Brief pause for animation effect
-
 # Main content area with enhanced UX
 if go:
-    # Update status
-    if 'status_placeholder' in locals():
-        status_placeholder.success("✅ Prediction engine ready!")
+    # Input validation with better error messages, before any status UI or timing starts
+    if not (-90 <= lat <= 90):
+        st.error("❌ Invalid latitude! Must be between -90° and 90°")
+        st.stop()
+    if not (-180 <= lon <= 180):
+        st.error("❌ Invalid longitude! Must be between -180° and 180°")
+        st.stop()
+    if alt_m < -1000:
+        st.error("❌ Invalid altitude! Must be ≥ -1000 meters")
+        st.stop()
+    if not norads:
+        st.error("❌ Select at least one satellite!")
+        st.stop()
 
-    # Input validation with better error messages
     try:
-        if not (-90 <= lat <= 90):
-            st.error("❌ Invalid latitude! Must be between -90° and 90°")
-            st.stop()
-        if not (-180 <= lon <= 180):
-            st.error("❌ Invalid longitude! Must be between -180° and 180°")
-            st.stop()
-        if alt_m < -1000:
-            st.error("❌ Invalid altitude! Must be ≥ -1000 meters")
-            st.stop()
-
-        # Enhanced progress tracking with phases
-        progress_phases = [
-            "🔄 Initializing prediction engine...",
-            "📡 Fetching latest TLE data...",
-            "🛰️ Building satellite orbital model...",
-            "⚡ Computing pass predictions...",
-            "📊 Analyzing results...",
-            "✅ Mission complete!"
-        ]
-
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-
-        start_time = time.time()
-
-        # Phase 1: Initialize
-        status_text.markdown(f"**{progress_phases[0]}**")
-        progress_bar.progress(5)
-
-        # Phase 2: Fetch TLE
-        status_text.markdown(f"**{progress_phases[1]}**")
-        progress_bar.progress(25)
-        name, l1, l2 = fetch_tle_cached(int(norad))
-
-        # Phase 3: Create satellite model
-        status_text.markdown(f"**{progress_phases[2]}**")
-        progress_bar.progress(45)
-        ts = load.timescale()
-        sat = EarthSatellite(l1, l2, name, ts)
-
-        # Phase 4: Compute passes
-        status_text.markdown(f"**{progress_phases[3]}**")
-        progress_bar.progress(70)
-        passes = compute_passes_optimized(
-            sat,
-            float(lat),
-            float(lon),
-            float(alt_m),
-            int(hours),
-            float(min_elev),
-            float(time_step)
-        )
-
-        # Phase 5: Analyze results
-        status_text.markdown(f"**{progress_phases[4]}**")
-        progress_bar.progress(90)
+        start_time = time.perf_counter()
 
-        computation_time = time.time() - start_time
+        # One status container for the whole run: fetch TLEs, build the models, search for passes
+        with st.status("⚡ Computing pass predictions...", expanded=False) as status:
+            if len(norads) > 1:
+                # Several satellites: one SatrecArray propagation over a shared time grid
+                from src.orbits.pass_predictor import compute_passes_batch, observer_site
 
-        # Phase 6: Complete
-        progress_bar.progress(100)
-        status_text.markdown(f"**{progress_phases[5]}** ✨")
-
-        # Clear progress after success
-        time.sleep(1.5)
-        progress_bar.empty()
-        status_text.empty()
+                sats = [get_satellite(l1, l2, name) for name, l1, l2 in get_tles(tuple(norads))]
+                site = observer_site(float(lat), float(lon), float(alt_m))
+                batch = compute_passes_batch(sats, site, int(hours), float(min_elev))
+            else:
+                name, l1, l2 = get_tle(int(norad))
+                arrays = cached_passes(
+                    l1,
+                    l2,
+                    name,
+                    float(lat),
+                    float(lon),
+                    float(alt_m),
+                    int(hours),
+                    float(min_elev)
+                )
+            computation_time = time.perf_counter() - start_time
+            status.update(label="✅ Mission complete!", state="complete")
 
     except Exception as e:
         st.error(f"🚨 Mission failed: {str(e)}")
@@ -753,6 +353,41 @@ if go:
     # Enhanced results display with professional layout
     st.markdown("---")
 
+    if len(norads) > 1:
+        from src.orbits.pass_predictor import PassArrays
+
+        st.markdown("## 🛰️ Satellite Comparison")
+        st.caption(f"Location: {lat:.4f}°, {lon:.4f}°")
+
+        counts = [len(arrays) for arrays in batch]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("🛰️ Satellites", len(sats))
+        with col2:
+            st.metric("📊 Passes Found", sum(counts))
+        with col3:
+            st.metric("⚡ Computation Time", f"{computation_time:.2f}s")
+
+        if sum(counts):
+            arrays = PassArrays.concatenate(batch)
+            order = np.argsort(arrays.starts, kind="stable")
+            st.dataframe(
+                pd.DataFrame({
+                    "Satellite": np.repeat([sat.name for sat in sats], counts)[order],
+                    "Start (UTC)": utc_minutes(arrays.starts[order]),
+                    "Peak (UTC)": utc_minutes(arrays.peaks[order]),
+                    "End (UTC)": utc_minutes(arrays.ends[order]),
+                    "Max Elev (°)": np.round(arrays.max_elevation_deg[order], 1),
+                    "Duration (min)": np.round((arrays.ends - arrays.starts)[order] / np.timedelta64(60, "s"), 1)
+                }),
+                use_container_width=True,
+                hide_index=True,
+                column_config=PASS_COLUMN_CONFIG
+            )
+        else:
+            st.warning("🔍 No passes found in the selected window")
+        st.stop()
+
     # Header with satellite info and performance metrics
     col1, col2, col3 = st.columns([2, 1, 1])
 
@@ -760,17 +395,10 @@ if go:
         st.markdown(f"## 🛰️ {name}")
         st.caption(f"NORAD ID: {norad} | Location: {lat:.4f}°, {lon:.4f}°")
 
-    with col2:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("⚡ Computation Time", f"{computation_time:.2f}s")
-        st.markdown('</div>', unsafe_allow_html=True)
+    col2.metric("⚡ Computation Time", f"{computation_time:.2f}s")
+    col3.metric("📊 Passes Found", len(arrays))
 
-    with col3:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("📊 Passes Found", len(passes))
-        st.markdown('</div>', unsafe_allow_html=True)
-
-    if not passes:
+    if not len(arrays):
         st.warning("🔍 No passes found in the selected window")
         st.info("""
         **💡 Optimization Suggestions:**
@@ -785,97 +413,49 @@ if go:
         st.markdown("### 📋 Pass Schedule")
         st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
 
-        def fmt(d: dt.datetime) -> str:
-            return d.strftime("%Y-%m-%d %H:%M")
-
-        # Create comprehensive data with advanced metrics
-        data = []
-        for i, p in enumerate(passes, 1):
-            duration = p.end - p.start
-            duration_minutes = duration.total_seconds() / 60
-
-            # Time until pass starts (fixed timezone handling)
-            now = dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
-            pass_start = p.start
-            if hasattr(p.start, 'tzinfo') and p.start.tzinfo is not None:
-                pass_start = p.start.replace(tzinfo=None)
-            time_until = pass_start - now
-            hours_until = time_until.total_seconds() / 3600
-
-            # Calculate pass quality score (0-100)
-            quality_score = min(100, (p.max_elevation_deg / 90) * 60 + (duration_minutes / 15) * 40)
-
-            # Visibility rating with emojis
-            if p.max_elevation_deg >= 60:
-                visibility = "🌟 Excellent"
-            elif p.max_elevation_deg >= 40:
-                visibility = "✅ Good"
-            elif p.max_elevation_deg >= 20:
-                visibility = "⚠️ Fair"
-            else:
-                visibility = "❌ Poor"
-
-            data.append({
-                "#": i,
-                "Start (UTC)": fmt(p.start),
-                "Peak (UTC)": fmt(p.peak),
-                "End (UTC)": fmt(p.end),
-                "Max Elev (°)": round(p.max_elevation_deg, 1),
-                "Duration (min)": round(duration_minutes, 1),
-                "Hours Until": round(hours_until, 1) if hours_until > 0 else "🔴 Live",
-                "Visibility": visibility,
-                "Quality Score": round(quality_score, 0)
-            })
-
-        df = pd.DataFrame(data)
+        # Every column below is built from the whole arrays instead of one dict per pass
+        elev = arrays.max_elevation_deg
+        # One "now" for the whole results view, so the table and the next-pass note agree
+        now = np.datetime64(dt.datetime.now(dt.timezone.utc).replace(tzinfo=None), "us")
+        duration_minutes = (arrays.ends - arrays.starts) / np.timedelta64(60, "s")
+        hours_until = (arrays.starts - now) / np.timedelta64(3600, "s")
+
+        # Pass quality score (0-100) and visibility rating with emojis
+        quality_score, visibility_bin = pass_quality(elev, duration_minutes, VISIBILITY_EDGES)
+        visibility = pd.Categorical.from_codes(visibility_bin, categories=VISIBILITY_LABELS)
+
+        df = pd.DataFrame({
+            "#": np.arange(1, len(arrays) + 1),
+            "Start (UTC)": utc_minutes(arrays.starts),
+            "Peak (UTC)": utc_minutes(arrays.peaks),
+            "End (UTC)": utc_minutes(arrays.ends),
+            # Typed numeric columns rather than a mixed number/"Live" string column,
+            # so Arrow serializes them directly instead of as Python objects
+            "Max Elev (°)": np.round(elev, 1).astype(np.float32),
+            "Duration (min)": np.round(duration_minutes, 1).astype(np.float32),
+            "Hours Until": np.where(hours_until > 0, np.round(hours_until, 1), np.nan).astype(np.float32),
+            "Live": hours_until <= 0,
+            "Visibility": visibility,
+            "Quality Score": np.round(quality_score).astype(np.int16)
+        })
 
         # Enhanced dataframe with custom styling and animations
         st.dataframe(
             df,
             use_container_width=True,
-            column_config={
-                "#": st.column_config.NumberColumn("Pass #", width="small"),
-                "Max Elev (°)": st.column_config.NumberColumn(
-                    "Max Elev (°)",
-                    help="Maximum elevation angle - higher is better visibility",
-                    format="%.1f°"
-                ),
-                "Duration (min)": st.column_config.NumberColumn(
-                    "Duration (min)",
-                    help="Total pass duration",
-                    format="%.1f"
-                ),
-                "Hours Until": st.column_config.TextColumn(
-                    "Time Until",
-                    help="Hours until pass starts"
-                ),
-                "Visibility": st.column_config.TextColumn(
-                    "Visibility Rating",
-                    help="Expected visibility quality"
-                ),
-                "Quality Score": st.column_config.NumberColumn(
-                    "Quality Score",
-                    help="Overall pass quality (0-100)",
-                    format="%.0f"
-                )
-            }
+            column_config=PASS_COLUMN_CONFIG
         )
         st.markdown('</div>', unsafe_allow_html=True)
 
         # Add interactive pass details expander
         with st.expander("🔍 Detailed Pass Analysis", expanded=False):
-            for i, p in enumerate(passes, 1):
-                duration = p.end - p.start
-                duration_minutes = duration.total_seconds() / 60
-
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric(f"Pass {i} Elevation", f"{p.max_elevation_deg:.1f}°")
-                with col2:
-                    st.metric(f"Pass {i} Duration", f"{duration_minutes:.1f} min")
-                with col3:
-                    quality = min(100, (p.max_elevation_deg / 90) * 60 + (duration_minutes / 15) * 40)
-                    st.metric(f"Pass {i} Quality", f"{quality:.0f}/100")
+            # One element for every pass, reusing the table's columns, instead of three metrics per pass
+            st.dataframe(
+                df[["#", "Max Elev (°)", "Duration (min)", "Quality Score"]],
+                use_container_width=True,
+                hide_index=True,
+                column_config=PASS_COLUMN_CONFIG
+            )
 
         # Advanced Analytics Dashboard
         st.markdown("### 📊 Mission Analytics")
@@ -884,68 +464,55 @@ if go:
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            total_passes = len(passes)
+            total_passes = len(arrays)
             st.metric("🎯 Total Passes", total_passes)
 
+        # Summary statistics are reductions over the same columns as the table
         with col2:
-            avg_elevation = sum(p.max_elevation_deg for p in passes) / len(passes)
+            avg_elevation = float(elev.mean())
             st.metric("📈 Avg Elevation", f"{avg_elevation:.1f}°")
 
         with col3:
-            avg_duration = sum((p.end - p.start).total_seconds() for p in passes) / len(passes) / 60
+            avg_duration = float(duration_minutes.mean())
             st.metric("⏱️ Avg Duration", f"{avg_duration:.1f} min")
 
         with col4:
-            best_pass = max(passes, key=lambda p: p.max_elevation_deg)
-            st.metric("🏆 Best Pass", f"{best_pass.max_elevation_deg:.1f}°")
+            best = int(elev.argmax())
+            st.metric("🏆 Best Pass", f"{elev[best]:.1f}°",
+                      help=f"Pass {best + 1}, starting {df['Start (UTC)'].iat[best]} UTC")
 
         # Additional insights
         col1, col2 = st.columns(2)
 
         with col1:
-            # Next pass information
-            now = dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
-            upcoming_passes = []
-            for p in passes:
-                pass_start = p.start
-                if hasattr(p.start, 'tzinfo') and p.start.tzinfo is not None:
-                    pass_start = p.start.replace(tzinfo=None)
-                if pass_start > now:
-                    upcoming_passes.append(p)
-
-            if upcoming_passes:
-                next_pass = min(upcoming_passes, key=lambda p: p.start if not hasattr(p.start, 'tzinfo') or p.start.tzinfo is None else p.start.replace(tzinfo=None))
-                next_pass_start = next_pass.start
-                if hasattr(next_pass.start, 'tzinfo') and next_pass.start.tzinfo is not None:
-                    next_pass_start = next_pass.start.replace(tzinfo=None)
-                time_to_next = next_pass_start - now
-                hours_to_next = time_to_next.total_seconds() / 3600
-                st.info(f"🚀 **Next Pass:** {fmt(next_pass.start)} UTC ({hours_to_next:.1f} hours)")
+            # Next pass information: passes come back in start order, so a binary search finds it
+            next_index = int(np.searchsorted(arrays.starts, now, side="right"))
+            if next_index < len(arrays):
+                st.info(f"🚀 **Next Pass:** {df['Start (UTC)'].iat[next_index]} UTC ({hours_until[next_index]:.1f} hours)")
             else:
                 st.info("📅 **Next Pass:** No upcoming passes in window")
 
         with col2:
             # Visibility distribution
-            excellent = sum(1 for p in passes if p.max_elevation_deg >= 60)
-            good = sum(1 for p in passes if 40 <= p.max_elevation_deg < 60)
-            fair = sum(1 for p in passes if 20 <= p.max_elevation_deg < 40)
-            poor = sum(1 for p in passes if p.max_elevation_deg < 20)
+            poor, fair, good, excellent = np.bincount(visibility_bin, minlength=len(VISIBILITY_LABELS)).tolist()
 
             visibility_stats = f"🌟 {excellent} | ✅ {good} | ⚠️ {fair} | ❌ {poor}"
             st.info(f"**Visibility Distribution:** {visibility_stats}")
 
         # Performance and Technical Details
         with st.expander("🔧 Technical Performance", expanded=False):
+            from src.orbits.pass_predictor import COARSE_STEP_S
+
             col1, col2, col3 = st.columns(3)
 
             with col1:
                 st.metric("⚡ Computation Time", f"{computation_time:.3f}s")
-                st.metric("🎯 Time Resolution", f"{time_step} min")
+                st.metric("🎯 Time Resolution", f"{COARSE_STEP_S / 60:g} min")
 
             with col2:
                 st.metric("⏰ Search Window", f"{hours} hours")
-                data_points = int(hours * 60 / time_step)
-                st.metric("📊 Data Points", f"~{data_points:,}")
+                # Samples on the coarse grid; crossings are then refined by root finding
+                st.metric("📊 Data Points", f"{int(hours * 3600 / COARSE_STEP_S) + 1:,}")
 
             with col3:
                 st.metric("🛰️ Satellite", norad)
@@ -973,6 +540,29 @@ if go:
         """)
 
 else:
+    # While the user sets up a run, fetch TLEs for the most-picked presets in the background
+    prefetch_tles(tuple(norad for norad in SATELLITE_PRESETS.values() if norad is not None)[:3])
+
+    with intro:
+        # Glassmorphism status dashboard
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-online"></span><strong>SYSTEM</strong></div><div style="color: #00ff00; font-weight: 500;">ONLINE</div></div>', unsafe_allow_html=True)
+        with col2:
+            st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-active"></span><strong>TLE DATA</strong></div><div style="color: #667eea; font-weight: 500;">SYNCED</div></div>', unsafe_allow_html=True)
+        with col3:
+            st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-active"></span><strong>ORBITAL</strong></div><div style="color: #4facfe; font-weight: 500;">ENGAGED</div></div>', unsafe_allow_html=True)
+        with col4:
+            st.markdown('<div class="metric-card"><div style="display: flex; align-items: center; justify-content: center; margin-bottom: 0.5rem;"><span class="status-indicator status-standby"></span><strong>STATUS</strong></div><div style="color: #ffa500; font-weight: 500;">STANDBY</div></div>', unsafe_allow_html=True)
+
+        # Glassmorphism mission briefing
+        st.markdown("""
+        <div class="info-box">
+            <h4>🚀 Neural Control Matrix</h4>
+            <p>Advanced orbital prediction algorithms initialized • Real-time TLE database connected • Quantum computing systems ready for satellite trajectory calculations and pass predictions with AI-enhanced accuracy.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
     # Enhanced welcome screen with interactive demo
     st.markdown("---")
 
@@ -1018,13 +608,7 @@ else:
         """)
 
         # Demo button for ISS
-        if st.button("🚀 Try ISS Demo", type="secondary", use_container_width=True):
-            st.session_state.demo_lat = 28.6139
-            st.session_state.demo_lon = 77.2090
-            st.session_state.demo_hours = 24
-            st.session_state.demo_min_elev = 10
-            st.session_state.demo_norad = 25544
-            st.rerun()
+        st.button("🚀 Try ISS Demo", type="secondary", use_container_width=True, on_click=load_iss_demo)
 
     # Feature showcase
     st.markdown("---")
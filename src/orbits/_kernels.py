@@ -0,0 +1,107 @@
+"""Array kernels shared by the orbit modules."""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+WGS84_RADIUS_KM = 6378.137
+WGS84_E2 = (2.0 - 1.0 / 298.257223563) / 298.257223563
+
+
+def enu_elevation(
+    r_itrf: np.ndarray,
+    site_itrf: np.ndarray,
+    rotation: np.ndarray,
+    dtype: type = np.float64,
+    work: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Elevation in degrees of ITRF positions ``r_itrf`` (3, ...) seen from ``site_itrf`` (3,).
+
+    The result has shape ``r_itrf.shape[1:]``, so a (3, S, T) batch of satellites and
+    times is handled in the same pass as a single track. The cast to ``dtype`` is fused
+    into the observer subtraction, and every step writes into ``work``, a (2, 3, N)
+    ``dtype`` scratch array for the N positions. Callers evaluating one shape many times
+    pass the same ``work`` so repeated calls allocate nothing; the result is then a view
+    into it, valid until the next call.
+    """
+    flat = r_itrf.reshape(3, -1)
+    if work is None:
+        work = np.empty((2,) + flat.shape, dtype=dtype)
+    delta, enu = work
+    np.subtract(flat, site_itrf[:, None], out=delta, dtype=dtype)
+    np.matmul(rotation.astype(dtype, copy=False), delta, out=enu)
+    horizontal = np.hypot(enu[0], enu[1], out=delta[0])
+    elevation = np.arctan2(enu[2], horizontal, out=enu[0])
+    return np.asarray(np.degrees(elevation, out=elevation)).reshape(r_itrf.shape[1:])
+
+
+def geodetic_from_itrf(r_itrf: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """WGS84 latitude, longitude (degrees) and height (km) of ITRF positions ``r_itrf`` (3, ...) in km.
+
+    Same three fixed-point iterations as Skyfield's ``wgs84.subpoint``, applied to
+    whole arrays at once.
+    """
+    x, y, z = r_itrf
+    horizontal = np.hypot(x, y)
+    lat = np.arctan2(z, horizontal)
+    for _ in range(3):
+        sin_lat = np.sin(lat)
+        e2_sin_lat = WGS84_E2 * sin_lat
+        radius_of_curvature = WGS84_RADIUS_KM / np.sqrt(1.0 - e2_sin_lat * sin_lat)
+        lat = np.arctan2(z + radius_of_curvature * e2_sin_lat, horizontal)
+    height = horizontal / np.cos(lat) - radius_of_curvature
+    return np.degrees(lat), np.degrees(np.arctan2(y, x)), height
+
+
+def split_antimeridian(lats: np.ndarray, lons: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Split a ground track wherever consecutive longitudes jump by more than 180°."""
+    breaks = np.flatnonzero(np.abs(np.diff(lons)) > 180.0) + 1
+    return list(zip(np.split(lats, breaks), np.split(lons, breaks)))
+
+
+def simplify_polyline(x: np.ndarray, y: np.ndarray, tolerance: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker: boolean mask of the vertices to keep within ``tolerance``.
+
+    Endpoints are always kept. Each split measures all interior distances to the
+    chord in one NumPy expression, so only the recursion itself runs in Python.
+    """
+    keep = np.zeros(len(x), dtype=bool)
+    if len(x) == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    stack = [(0, len(x) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        chord_x, chord_y = x[last] - x[first], y[last] - y[first]
+        offset_x, offset_y = x[first + 1 : last] - x[first], y[first + 1 : last] - y[first]
+        chord = np.hypot(chord_x, chord_y)
+        if chord == 0.0:
+            distance = np.hypot(offset_x, offset_y)
+        else:
+            distance = np.abs(chord_x * offset_y - chord_y * offset_x) / chord
+        farthest = int(np.argmax(distance))
+        if distance[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+def pass_quality(
+    max_elevation_deg: np.ndarray,
+    duration_min: np.ndarray,
+    visibility_edges: Tuple[float, ...] = (20.0, 40.0, 60.0),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Quality score (0-100) and visibility band of each pass.
+
+    Quality gives up to 60 points for a 90° peak and 40 for a 15-minute pass, capped at 100,
+    and is accumulated in one buffer. The band is the index of the peak elevation among
+    ``visibility_edges``, so 0 is below the first edge.
+    """
+    quality = np.multiply(max_elevation_deg, 60.0 / 90.0)
+    quality += np.multiply(duration_min, 40.0 / 15.0)
+    np.minimum(quality, 100.0, out=quality)
+    return quality, np.digitize(max_elevation_deg, visibility_edges)
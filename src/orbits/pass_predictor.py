@@ -1,26 +1,114 @@
 import datetime as dt
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import requests
 import typer
 from rich.console import Console
 from rich.table import Table
+from scipy.optimize import brentq
+from sgp4.api import SatrecArray, jday
 from skyfield.api import EarthSatellite, load, wgs84
+from skyfield.sgp4lib import theta_GMST1982
+from skyfield.timelib import Timescale
+
+from src.orbits._kernels import enu_elevation, geodetic_from_itrf
 
 console = Console()
+DAY_S = 86400.0
+COARSE_STEP_S = 60.0
+REFINE_XTOL_S = 0.5
 app = typer.Typer(help="Predict satellite passes using live TLEs.")
 
 TLE_SOURCES = {
 	"celestrak": "https://celestrak.org/NORAD/elements/gp.php?CATNR={norad}&FORMAT=tle",
 }
 
+# On-disk TLE store, revalidated with ETag / If-Modified-Since once older than TLE_MAX_AGE_S.
+TLE_CACHE_DIR = Path(
+	os.environ.get("SPACE_EXPO_CACHE_DIR", Path.home() / ".cache" / "space-expo")
+) / "tle"
+TLE_MAX_AGE_S = 2 * 3600
+# Matches urllib3's default per-host pool size, so concurrent fetches all reuse kept-alive connections.
+TLE_FETCH_WORKERS = 10
 
-def fetch_tle(norad_id: int) -> Tuple[str, str, str]:
-	url = TLE_SOURCES["celestrak"].format(norad=norad_id)
-	resp = requests.get(url, timeout=15)
-	resp.raise_for_status()
-	lines = [line.strip() for line in resp.text.splitlines() if line.strip()]
+_session = requests.Session()
+_session.headers["User-Agent"] = "space-expo-satellite-predictor"
+
+
+@lru_cache(maxsize=None)
+def _timescale() -> Timescale:
+	"""Load the builtin leap-second and delta-T tables once per process."""
+	return load.timescale(builtin=True)
+
+
+def _read_cached_tle(path: Path) -> Optional[Dict[str, Any]]:
+	"""Load a cache entry, treating a missing, truncated or hand-edited file as a miss."""
+	try:
+		entry = json.loads(path.read_text())
+	except (OSError, ValueError):
+		return None
+	if not (
+		isinstance(entry, dict)
+		and isinstance(entry.get("url"), str)
+		and isinstance(entry.get("body"), str)
+		and isinstance(entry.get("fetched_at"), (int, float))
+		and not isinstance(entry["fetched_at"], bool)
+		and all(isinstance(entry.get(key), (str, type(None))) for key in ("etag", "last_modified"))
+	):
+		return None
+	return entry
+
+
+def _fetch_tle_text(norad_id: int) -> str:
+	"""Return the raw TLE text, revalidating an on-disk copy with a conditional GET.
+
+	Celestrak only refreshes GP data a few times a day, so a copy younger than
+	``TLE_MAX_AGE_S`` is returned without touching the network at all.
+	"""
+	path = TLE_CACHE_DIR / f"{norad_id}.json"
+	cached = _read_cached_tle(path)
+	if cached and time.time() - cached["fetched_at"] < TLE_MAX_AGE_S:
+		return str(cached["body"])
+
+	headers = {}
+	if cached and cached.get("etag"):
+		headers["If-None-Match"] = cached["etag"]
+	if cached and cached.get("last_modified"):
+		headers["If-Modified-Since"] = cached["last_modified"]
+	url = cached["url"] if cached else TLE_SOURCES["celestrak"].format(norad=norad_id)
+
+	resp = _session.get(url, headers=headers, timeout=15)
+	if resp.status_code == 304 and cached:
+		entry = dict(cached, fetched_at=time.time())
+	else:
+		resp.raise_for_status()
+		entry = {
+			# Store the post-redirect URL so later revalidations skip the redirect hop.
+			"url": resp.url,
+			"etag": resp.headers.get("ETag"),
+			"last_modified": resp.headers.get("Last-Modified"),
+			"fetched_at": time.time(),
+			"body": resp.text,
+		}
+
+	try:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_text(json.dumps(entry))
+	except OSError:
+		pass  # A read-only cache directory only costs us the next revalidation.
+	return str(entry["body"])
+
+
+def _parse_tle(norad_id: int, text: str) -> Tuple[str, str, str]:
+	lines = [line.strip() for line in text.splitlines() if line.strip()]
 	if len(lines) < 2:
 		raise ValueError("Could not fetch TLE: not enough lines")
 	name = f"NORAD {norad_id}"
@@ -32,6 +120,23 @@ def fetch_tle(norad_id: int) -> Tuple[str, str, str]:
 	return name, l1, l2
 
 
+def fetch_tle(norad_id: int) -> Tuple[str, str, str]:
+	return _parse_tle(norad_id, _fetch_tle_text(norad_id))
+
+
+def fetch_tles(norad_ids: Sequence[int]) -> List[Tuple[str, str, str]]:
+	"""Fetch several TLEs concurrently over the shared keep-alive session.
+
+	Results come back in the order of ``norad_ids``; fresh on-disk copies still skip
+	the network, so only stale or missing IDs cost a request.
+	"""
+	if len(norad_ids) <= 1:
+		return [fetch_tle(norad_id) for norad_id in norad_ids]
+	workers = min(len(norad_ids), TLE_FETCH_WORKERS)
+	with ThreadPoolExecutor(max_workers=workers) as pool:
+		return list(pool.map(fetch_tle, norad_ids))
+
+
 @dataclass
 class PassEvent:
 	start: dt.datetime
@@ -40,55 +145,272 @@ class PassEvent:
 	max_elevation_deg: float
 
 
+@dataclass
+class PassArrays:
+	"""Passes stored column-wise: naive-UTC ``datetime64[us]`` times and float64 elevations."""
+
+	starts: np.ndarray
+	peaks: np.ndarray
+	ends: np.ndarray
+	max_elevation_deg: np.ndarray
+
+	def __len__(self) -> int:
+		return len(self.starts)
+
+	@classmethod
+	def concatenate(cls, parts: Sequence["PassArrays"]) -> "PassArrays":
+		return cls(
+			starts=np.concatenate([part.starts for part in parts]),
+			peaks=np.concatenate([part.peaks for part in parts]),
+			ends=np.concatenate([part.ends for part in parts]),
+			max_elevation_deg=np.concatenate([part.max_elevation_deg for part in parts]),
+		)
+
+	def to_events(self) -> List[PassEvent]:
+		return [
+			PassEvent(start=start, peak=peak, end=end, max_elevation_deg=elevation)
+			for start, peak, end, elevation in zip(
+				self.starts.tolist(), self.peaks.tolist(), self.ends.tolist(), self.max_elevation_deg.tolist()
+			)
+		]
+
+
+def _enu_rotation(latitude_deg: float, longitude_deg: float) -> np.ndarray:
+	"""Return the (3, 3) matrix rotating ITRF offsets into east/north/up at the site."""
+	lat = np.radians(latitude_deg)
+	lon = np.radians(longitude_deg)
+	sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+	sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+	return np.array(
+		[
+			[-sin_lon, cos_lon, 0.0],
+			[-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+			[cos_lat * cos_lon, cos_lat * sin_lon, sin_lat],
+		]
+	)
+
+
+@dataclass(frozen=True)
+class ObserverSite:
+	"""Ground site with its time-independent ITRF position (km) and ENU basis precomputed."""
+
+	latitude_deg: float
+	longitude_deg: float
+	altitude_m: float
+	itrf_km: np.ndarray
+	rotation: np.ndarray
+
+
+def observer_site(latitude_deg: float, longitude_deg: float, altitude_m: float = 0.0) -> ObserverSite:
+	"""Build an :class:`ObserverSite`; callers may keep and reuse it across predictions."""
+	return ObserverSite(
+		latitude_deg=latitude_deg,
+		longitude_deg=longitude_deg,
+		altitude_m=altitude_m,
+		itrf_km=wgs84.latlon(latitude_deg, longitude_deg, altitude_m).itrs_xyz.km,
+		rotation=_enu_rotation(latitude_deg, longitude_deg),
+	)
+
+
+def _pass_windows(above: np.ndarray) -> List[Tuple[int, int]]:
+	"""Return (rise, set) sample indices for every completed pass in ``above``."""
+	edges = np.diff(above.astype(np.int8))
+	rises = np.flatnonzero(edges == 1) + 1
+	sets = np.flatnonzero(edges == -1) + 1
+	if above[0]:
+		rises = np.concatenate(([0], rises))
+	if len(rises) == 0:
+		return []
+	sets = sets[sets > rises[0]]
+	return list(zip(rises[: len(sets)].tolist(), sets.tolist()))
+
+
+def _itrf_positions(
+	sats: Sequence[EarthSatellite],
+	ts: Timescale,
+	start: dt.datetime,
+	offsets_s: np.ndarray,
+) -> np.ndarray:
+	"""Earth-fixed positions in km, shape (3, len(sats), len(offsets_s)).
+
+	TEME goes straight to ITRF with one GMST rotation; the precession-nutation work
+	``EarthSatellite.at`` does to reach GCRS is never needed here.
+	"""
+	seconds = start.second + start.microsecond / 1e6
+	times = ts.utc(start.year, start.month, start.day, start.hour, start.minute, seconds + offsets_s)
+	jd, fr = jday(start.year, start.month, start.day, start.hour, start.minute, seconds)
+
+	# One SGP4 call propagates every satellite over every offset: r_teme is (S, T, 3).
+	# The near-Earth/deep-space split is fixed per satellite when the TLE is parsed
+	# (Satrec.method 'n' or 'd'), so LEO satellites never run the lunar-solar terms.
+	_, r_teme, _ = SatrecArray([sat.model for sat in sats]).sgp4(
+		np.full(offsets_s.shape, jd), fr + offsets_s / DAY_S
+	)
+
+	# TEME -> ITRF is a z-rotation by GMST that depends on time only, so it is shared by all satellites.
+	theta, _ = theta_GMST1982(times.whole, times.ut1_fraction)
+	cos_t, sin_t = np.cos(theta), np.sin(theta)
+	x, y, z = r_teme[..., 0], r_teme[..., 1], r_teme[..., 2]
+	return np.stack((cos_t * x + sin_t * y, cos_t * y - sin_t * x, z))
+
+
+def _elevations(
+	sats: Sequence[EarthSatellite],
+	site_itrf: np.ndarray,
+	rotation: np.ndarray,
+	ts: Timescale,
+	start: dt.datetime,
+	offsets_s: np.ndarray,
+	dtype: type = np.float64,
+) -> np.ndarray:
+	"""Topocentric elevation in degrees, shape (len(sats), len(offsets_s)).
+
+	SGP4 and the TEME->ITRF rotation always run in float64; ``dtype`` only sets the
+	precision of the observer subtraction, ENU rotation and angle computation.
+	"""
+	r_itrf = _itrf_positions(sats, ts, start, offsets_s)
+	return enu_elevation(r_itrf, site_itrf, rotation, dtype=dtype)
+
+
+def ground_track(
+	sat: EarthSatellite, start: dt.datetime, offsets_s: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Sub-satellite latitude, longitude (degrees) and altitude (km) at ``offsets_s`` seconds after ``start``."""
+	return geodetic_from_itrf(_itrf_positions([sat], _timescale(), start, offsets_s)[:, 0])
+
+
+def _parabolic_peak(y_prev: float, y_peak: float, y_next: float) -> float:
+	"""Offset of the vertex of the parabola through three equally spaced samples, in steps."""
+	curvature = y_prev - 2.0 * y_peak + y_next
+	if curvature >= 0.0:
+		return 0.0
+	return float(np.clip(0.5 * (y_prev - y_next) / curvature, -1.0, 1.0))
+
+
+def _refine_passes(
+	elevation_at: Callable[[float], float],
+	elevations: np.ndarray,
+	offsets_s: np.ndarray,
+	start: dt.datetime,
+	min_elevation_deg: float,
+) -> PassArrays:
+	"""Turn one satellite's coarse elevation grid into refined, column-wise passes."""
+
+	def above_threshold(offset_s: float) -> float:
+		return elevation_at(offset_s) - min_elevation_deg
+
+	def crossing(before_s: float, after_s: float) -> float:
+		try:
+			return float(brentq(above_threshold, before_s, after_s, xtol=REFINE_XTOL_S))
+		except ValueError:
+			# float32 coarse mask and float64 refinement disagree right at the threshold.
+			return after_s
+
+	# The sign-change vector gives the pass count up front, so each column is allocated once.
+	windows = _pass_windows(elevations >= min_elevation_deg)
+	rise_offsets = np.empty(len(windows))
+	peak_offsets = np.empty(len(windows))
+	set_offsets = np.empty(len(windows))
+	max_elevations = np.empty(len(windows))
+
+	# Root-find each crossing and fit the peak, touching only a few points per pass.
+	for i, (rise, set_) in enumerate(windows):
+		rise_s = float(offsets_s[rise])
+		if rise > 0:
+			rise_s = crossing(offsets_s[rise - 1], offsets_s[rise])
+		set_s = crossing(offsets_s[set_ - 1], offsets_s[set_])
+
+		peak = rise + int(np.argmax(elevations[rise:set_]))
+		peak_s = float(offsets_s[peak])
+		peak_elev = float(elevations[peak])
+		if 0 < peak < len(offsets_s) - 1:
+			step = _parabolic_peak(elevations[peak - 1], elevations[peak], elevations[peak + 1])
+			fitted_s = min(max(peak_s + step * COARSE_STEP_S, rise_s), set_s)
+			fitted_elev = elevation_at(fitted_s)
+			if fitted_elev > peak_elev:
+				peak_s, peak_elev = fitted_s, fitted_elev
+
+		rise_offsets[i], peak_offsets[i], set_offsets[i], max_elevations[i] = rise_s, peak_s, set_s, peak_elev
+
+	origin = np.datetime64(start, "us")
+	return PassArrays(
+		starts=origin + np.rint(rise_offsets * 1e6).astype("timedelta64[us]"),
+		peaks=origin + np.rint(peak_offsets * 1e6).astype("timedelta64[us]"),
+		ends=origin + np.rint(set_offsets * 1e6).astype("timedelta64[us]"),
+		max_elevation_deg=max_elevations,
+	)
+
+
+def compute_passes_batch(
+	sats: Sequence[EarthSatellite],
+	site: ObserverSite,
+	hours_ahead: int,
+	min_elevation_deg: float,
+	start: Optional[dt.datetime] = None,
+) -> List[PassArrays]:
+	"""Predict passes for several satellites over one shared time grid.
+
+	The window opens at ``start``, a timezone-aware datetime, or at the current time if
+	it is omitted. Returns one :class:`PassArrays` per satellite, in the order given.
+	"""
+	if not sats:
+		return []
+	ts = _timescale()
+
+	now = dt.datetime.now(dt.timezone.utc) if start is None else start.astimezone(dt.timezone.utc)
+	offsets_s = np.arange(hours_ahead * 60 + 1) * COARSE_STEP_S
+
+	# Site position and ENU basis are time-independent: precomputed on the site, broadcast over all samples.
+	site_itrf, rotation = site.itrf_km, site.rotation
+
+	# Coarse phase: one vectorized call over the whole window finds every threshold crossing.
+	# float32 is ample for a sign test against the threshold and halves the bytes moved.
+	coarse = _elevations(sats, site_itrf, rotation, ts, now, offsets_s, dtype=np.float32)
+
+	# Refinement phase: Brent and the peak fit make many single-point calls, so they go
+	# through scalar Satrec.sgp4 into reused position and ENU buffers rather than building a
+	# Time, a SatrecArray and fresh (1, 1, 3) arrays per evaluation. UT1-UTC drifts by
+	# milliseconds per day, so the value at ``now`` serves the whole window.
+	jd, fr = jday(now.year, now.month, now.day, now.hour, now.minute, now.second + now.microsecond / 1e6)
+	dut1_days = float(ts.from_datetime(now).dut1) / DAY_S
+	position = np.empty(3)
+	work = np.empty((2, 3, 1))
+
+	start = now.replace(tzinfo=None)
+	results = []
+	for sat, elevations in zip(sats, coarse):
+
+		def elevation_at(offset_s: float, model: Any = sat.model) -> float:
+			fraction = fr + offset_s / DAY_S
+			_, (x, y, z), _ = model.sgp4(jd, fraction)
+			theta, _ = theta_GMST1982(jd, fraction + dut1_days)
+			cos_t, sin_t = np.cos(theta), np.sin(theta)
+			position[0] = cos_t * x + sin_t * y
+			position[1] = cos_t * y - sin_t * x
+			position[2] = z
+			return float(enu_elevation(position, site_itrf, rotation, work=work))
+
+		results.append(_refine_passes(elevation_at, elevations, offsets_s, start, min_elevation_deg))
+	return results
+
+
+def compute_pass_arrays(
+	sat: EarthSatellite,
+	site: ObserverSite,
+	hours_ahead: int,
+	min_elevation_deg: float,
+	start: Optional[dt.datetime] = None,
+) -> PassArrays:
+	return compute_passes_batch([sat], site, hours_ahead, min_elevation_deg, start)[0]
+
+
 def compute_passes(
 	sat: EarthSatellite,
-	latitude_deg: float,
-	longitude_deg: float,
-	altitude_m: float,
+	site: ObserverSite,
 	hours_ahead: int,
 	min_elevation_deg: float,
 ) -> List[PassEvent]:
-	ts = load.timescale()
-
-	now = dt.datetime.now(dt.timezone.utc)
-	datetimes = [now + dt.timedelta(minutes=i) for i in range(hours_ahead * 60 + 1)]
-	times = ts.from_datetimes(datetimes)
-
-	observer = wgs84.latlon(latitude_deg, longitude_deg, altitude_m)
-
-	passes: List[PassEvent] = []
-	in_pass = False
-	current_start = None
-	current_peak = None
-	current_max_elev = -90.0
-
-	for t in times:
-		topocentric = (sat - observer).at(t)
-		alt, az, distance = topocentric.altaz()
-		elev_deg = alt.degrees
-
-		if elev_deg >= min_elevation_deg and not in_pass:
-			in_pass = True
-			current_start = t.utc_datetime().replace(tzinfo=None)
-			current_peak = current_start
-			current_max_elev = elev_deg
-		elif elev_deg >= min_elevation_deg and in_pass:
-			if elev_deg > current_max_elev:
-				current_max_elev = elev_deg
-				current_peak = t.utc_datetime().replace(tzinfo=None)
-		elif elev_deg < min_elevation_deg and in_pass:
-			end_dt = t.utc_datetime().replace(tzinfo=None)
-			passes.append(
-				PassEvent(
-					start=current_start,
-					peak=current_peak,
-					end=end_dt,
-					max_elevation_deg=current_max_elev,
-				)
-			)
-			in_pass = False
-
-	return passes
+	return compute_pass_arrays(sat, site, hours_ahead, min_elevation_deg).to_events()
 
 
 @app.command()
@@ -109,10 +431,10 @@ def predict(
 	name, l1, l2 = fetch_tle(norad)
 	console.print(f"Using TLE: {name}")
 
-	ts = load.timescale()
+	ts = _timescale()
 	satellite = EarthSatellite(l1, l2, name, ts)
 
-	passes = compute_passes(satellite, lat, lon, alt_m, hours, min_elev)
+	passes = compute_passes(satellite, observer_site(lat, lon, alt_m), hours, min_elev)
 
 	if not passes:
 		console.print("No passes found in the time window.")
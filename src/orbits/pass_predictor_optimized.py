@@ -1,6 +1,7 @@
 import datetime as dt
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 import math
 
@@ -10,6 +11,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from skyfield.api import EarthSatellite, load, wgs84
+from skyfield.timelib import Timescale
 from skyfield.toposlib import Topos
 
 console = Console()
@@ -27,6 +29,12 @@ TLE_CACHE_TTL = 3600  # 1 hour in seconds
 TLE_CACHE_MAX_SIZE = 100  # Maximum cache entries
 
 
+@lru_cache(maxsize=None)
+def _timescale() -> Timescale:
+    """Load the builtin leap-second and delta-T tables once per process."""
+    return load.timescale(builtin=True)
+
+
 def validate_coordinates(latitude: float, longitude: float, altitude: float) -> None:
     """Validate geographic coordinates."""
     if not -90 <= latitude <= 90:
@@ -162,7 +170,7 @@ def compute_passes_optimized(
     if not 0 <= min_elevation_deg <= 90:
         raise ValueError(f"Minimum elevation must be between 0 and 90 degrees, got {min_elevation_deg}")
 
-    ts = load.timescale()
+    ts = _timescale()
     observer = wgs84.latlon(latitude_deg, longitude_deg, altitude_m)
 
     # Advanced pass computation with multiple optimization layers
@@ -460,7 +468,7 @@ def predict(
         name, l1, l2 = fetch_tle_cached(norad)
         console.print(f"Using TLE: {name}")
 
-        ts = load.timescale()
+        ts = _timescale()
         satellite = EarthSatellite(l1, l2, name, ts)
 
         console.print(f"Computing passes with {time_step}-minute resolution...")
@@ -5,12 +5,14 @@ Performance comparison between original and optimized satellite pass predictor.
 
 import statistics
 import time
+from typing import Any, Dict, List
 
 from rich.console import Console
 from rich.table import Table
 from skyfield.api import EarthSatellite, load
 
 from src.orbits.pass_predictor import compute_passes as compute_passes_original
+from src.orbits.pass_predictor import observer_site
 
 # Import both versions
 from src.orbits.pass_predictor_optimized import compute_passes_optimized, fetch_tle_cached
@@ -31,7 +33,7 @@ def run_performance_comparison():
     console.rule("Satellite Pass Predictor Performance Comparison")
 
     # Test parameters
-    test_cases = [
+    test_cases: List[Dict[str, Any]] = [
         {
             "name": "Short window (6 hours)",
             "lat": 28.6139,
@@ -83,9 +85,7 @@ def run_performance_comparison():
             exec_time, passes = benchmark_function(
                 compute_passes_original,
                 sat,
-                test_case['lat'],
-                test_case['lon'],
-                test_case['alt_m'],
+                observer_site(test_case['lat'], test_case['lon'], test_case['alt_m']),
                 test_case['hours'],
                 test_case['min_elev']
             )
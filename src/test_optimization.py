@@ -8,6 +8,7 @@ import time
 from skyfield.api import EarthSatellite, load
 
 from src.orbits.pass_predictor import compute_passes as compute_passes_original
+from src.orbits.pass_predictor import observer_site
 
 # Import both versions
 from src.orbits.pass_predictor_optimized import compute_passes_optimized, fetch_tle_cached
@@ -47,7 +48,7 @@ def test_performance():
     print("TESTING ORIGINAL IMPLEMENTATION")
     print("-" * 40)
     start_time = time.time()
-    original_passes = compute_passes_original(sat, lat, lon, alt_m, hours, min_elev)
+    original_passes = compute_passes_original(sat, observer_site(lat, lon, alt_m), hours, min_elev)
     original_time = time.time() - start_time
 
     print(f"Execution time: {original_time:.3f} seconds")
@@ -4,12 +4,19 @@ Unit tests for satellite pass predictor functionality.
 """
 
 import datetime as dt
+import json
+import tempfile
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
+import numpy as np
 import requests
 
-from skyfield.api import EarthSatellite, load
+from skyfield.api import EarthSatellite, load, wgs84
 
+from src.orbits import pass_predictor
+from src.orbits._kernels import enu_elevation, pass_quality, simplify_polyline, split_antimeridian
 from src.orbits.pass_predictor_optimized import (
     PassEvent,
     compute_passes_optimized,
@@ -95,6 +102,119 @@ class TestPassComputation(unittest.TestCase):
             compute_passes_optimized(self.sat, 28.6139, 77.2090, 0.0, 6, 91.0)
 
 
+class TestVectorizedPassComputation(unittest.TestCase):
+    """Test the SatrecArray-based pass search in pass_predictor."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.ts = load.timescale()
+        self.sat = EarthSatellite(
+            "1 25544U 98067A   24301.50000000  .00000000  00000-0  00000-0 0  9999",
+            "2 25544  51.6400  90.0000 0002000   0.0000 000.0000 15.50000000    01",
+            "ISS (ZARYA)",
+            self.ts,
+        )
+        self.site = pass_predictor.observer_site(28.6139, 77.2090, 0.0)
+
+    def test_peak_matches_skyfield_altaz(self):
+        """Test that vectorized elevations agree with Skyfield's topocentric altaz."""
+        passes = pass_predictor.compute_passes(self.sat, self.site, 24, 10.0)
+        observer = wgs84.latlon(28.6139, 77.2090, 0.0)
+
+        self.assertTrue(passes)
+        for p in passes:
+            self.assertLessEqual(p.start, p.peak)
+            self.assertLess(p.peak, p.end)
+            t = self.ts.from_datetime(p.peak.replace(tzinfo=dt.timezone.utc))
+            alt, _, _ = (self.sat - observer).at(t).altaz()
+            self.assertAlmostEqual(alt.degrees, p.max_elevation_deg, places=2)
+            self.assertGreaterEqual(p.max_elevation_deg, 10.0)
+
+    def test_batch_matches_single_satellite(self):
+        """Test that a batched prediction returns each satellite's own passes."""
+        hubble = EarthSatellite(
+            "1 20580U 90037B   24301.50000000  .00000000  00000-0  00000-0 0  9999",
+            "2 20580  28.4700 120.0000 0002500   0.0000 000.0000 15.25000000    04",
+            "HST",
+            self.ts,
+        )
+        start = dt.datetime(2024, 10, 28, 12, 0, tzinfo=dt.timezone.utc)
+        batch = pass_predictor.compute_passes_batch([self.sat, hubble], self.site, 24, 10.0, start)
+        singles = [pass_predictor.compute_pass_arrays(sat, self.site, 24, 10.0, start) for sat in (self.sat, hubble)]
+
+        self.assertEqual(len(batch), 2)
+        for batched, single in zip(batch, singles):
+            np.testing.assert_array_equal(batched.starts, single.starts)
+            np.testing.assert_allclose(batched.max_elevation_deg, single.max_elevation_deg, atol=1e-6)
+
+    def test_ground_track_matches_skyfield_subpoint(self):
+        """Test that the Earth-fixed ground track agrees with Skyfield's GCRS-based subpoint."""
+        start = dt.datetime(2024, 10, 28, 12, 0, tzinfo=dt.timezone.utc)
+        offsets_s = np.linspace(0.0, 6 * 3600.0, 50)
+        lats, lons, alts = pass_predictor.ground_track(self.sat, start, offsets_s)
+
+        times = self.ts.from_datetimes([start + dt.timedelta(seconds=float(s)) for s in offsets_s])
+        subpoint = wgs84.subpoint(self.sat.at(times))
+        np.testing.assert_allclose(lats, subpoint.latitude.degrees, atol=1e-5)
+        np.testing.assert_allclose(alts, subpoint.elevation.km, atol=1e-3)
+        wrapped = (lons - subpoint.longitude.degrees + 180.0) % 360.0 - 180.0
+        np.testing.assert_allclose(wrapped, 0.0, atol=1e-5)
+
+    def test_pass_arrays_to_events(self):
+        """Test that columnar passes convert to PassEvent objects with the same values."""
+        arrays = pass_predictor.compute_pass_arrays(self.sat, self.site, 24, 10.0)
+        events = arrays.to_events()
+
+        self.assertEqual(len(events), len(arrays))
+        self.assertIsInstance(events[0].start, dt.datetime)
+        self.assertEqual([e.peak for e in events], arrays.peaks.tolist())
+        self.assertEqual([e.max_elevation_deg for e in events], arrays.max_elevation_deg.tolist())
+
+
+class TestTrackKernels(unittest.TestCase):
+    """Test the ground-track simplification helpers."""
+
+    def test_simplify_drops_collinear_points(self):
+        """Test that points on a straight line collapse to the endpoints."""
+        x = np.linspace(0.0, 10.0, 50)
+        keep = simplify_polyline(x, 2.0 * x, 0.01)
+        self.assertEqual(np.flatnonzero(keep).tolist(), [0, 49])
+
+    def test_simplify_keeps_corner(self):
+        """Test that a vertex farther than the tolerance survives."""
+        x = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        y = np.array([0.0, 0.0, 1.0, 0.0, 0.0])
+        self.assertTrue(simplify_polyline(x, y, 0.5)[2])
+
+    def test_split_antimeridian(self):
+        """Test that a longitude wrap starts a new segment."""
+        lats = np.array([0.0, 1.0, 2.0, 3.0])
+        lons = np.array([170.0, 179.0, -179.0, -170.0])
+        segments = split_antimeridian(lats, lons)
+        self.assertEqual([seg_lons.tolist() for _, seg_lons in segments], [[170.0, 179.0], [-179.0, -170.0]])
+
+    def test_pass_quality_matches_formula(self):
+        """Test quality scores, the 100 cap and visibility bands against the scalar formula."""
+        elev = np.array([10.0, 20.0, 45.0, 60.0, 89.0])
+        duration = np.array([2.0, 5.0, 8.0, 12.0, 15.0])
+        quality, band = pass_quality(elev, duration)
+        expected = np.minimum(100, (elev / 90) * 60 + (duration / 15) * 40)
+        np.testing.assert_allclose(quality, expected)
+        self.assertEqual(band.tolist(), [0, 1, 2, 3, 3])
+
+    def test_enu_elevation_reuses_work_buffer(self):
+        """Test that a caller-supplied scratch array gives the same elevations and is written in place."""
+        site = pass_predictor.observer_site(28.6, 77.2)
+        r_itrf = site.itrf_km[:, None] + np.array([[100.0, -50.0], [200.0, 30.0], [400.0, 10.0]])
+        expected = enu_elevation(r_itrf, site.itrf_km, site.rotation)
+
+        work = np.empty((2, 3, 2))
+        elevations = enu_elevation(r_itrf, site.itrf_km, site.rotation, work=work)
+
+        np.testing.assert_allclose(elevations, expected)
+        self.assertTrue(np.shares_memory(elevations, work))
+
+
 class TestTLEFetching(unittest.TestCase):
     """Test TLE fetching and caching."""
 
@@ -134,6 +254,93 @@ class TestTLEFetching(unittest.TestCase):
             fetch_tle_cached(25544)
 
 
+class TestTLEDiskCache(unittest.TestCase):
+    """Test the conditional-GET TLE store in pass_predictor."""
+
+    TLE_TEXT = """ISS (ZARYA)
+1 25544U 98067A   24301.50000000  .00000000  00000-0  00000-0 0  9999
+2 25544  51.6400  90.0000 0002000   0.0000 000.0000 15.50000000    01"""
+
+    def setUp(self):
+        """Point the cache at a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.object(pass_predictor, "TLE_CACHE_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _response(self, status_code, text=""):
+        response = Mock()
+        response.status_code = status_code
+        response.text = text
+        response.url = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=tle"
+        response.headers = {"ETag": '"abc"', "Last-Modified": "Mon, 28 Oct 2024 12:00:00 GMT"}
+        response.raise_for_status.return_value = None
+        return response
+
+    @patch.object(pass_predictor._session, "get")
+    def test_fresh_copy_skips_network(self, mock_get):
+        """Test that a second fetch within the max age is served from disk."""
+        mock_get.return_value = self._response(200, self.TLE_TEXT)
+
+        first = pass_predictor.fetch_tle(25544)
+        second = pass_predictor.fetch_tle(25544)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0], "ISS (ZARYA)")
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch.object(pass_predictor._session, "get")
+    def test_stale_copy_revalidates(self, mock_get):
+        """Test that a stale copy sends validators and reuses the body on 304."""
+        mock_get.return_value = self._response(200, self.TLE_TEXT)
+        pass_predictor.fetch_tle(25544)
+
+        path = Path(self.tmp.name) / "25544.json"
+        entry = json.loads(path.read_text())
+        entry["fetched_at"] = time.time() - pass_predictor.TLE_MAX_AGE_S - 1
+        path.write_text(json.dumps(entry))
+
+        mock_get.return_value = self._response(304)
+        name, l1, l2 = pass_predictor.fetch_tle(25544)
+
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"abc"')
+        self.assertIn("If-Modified-Since", headers)
+        self.assertEqual(name, "ISS (ZARYA)")
+        self.assertIn("1 25544U", l1)
+
+    @patch.object(pass_predictor._session, "get")
+    def test_malformed_copy_is_a_miss(self, mock_get):
+        """Test that a corrupt or incomplete cache file triggers a plain refetch."""
+        mock_get.return_value = self._response(200, self.TLE_TEXT)
+        path = Path(self.tmp.name) / "25544.json"
+
+        for content in ['{"fetched_at": ', '{"etag": "x"}', '[]', json.dumps(
+            {"url": 1, "body": None, "fetched_at": "now", "etag": 5}
+        )]:
+            path.write_text(content)
+            name, _, _ = pass_predictor.fetch_tle(25544)
+
+            self.assertEqual(name, "ISS (ZARYA)")
+            self.assertEqual(mock_get.call_args.kwargs["headers"], {})
+
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch.object(pass_predictor._session, "get")
+    def test_fetch_tles_preserves_order(self, mock_get):
+        """Test that concurrent fetches return one TLE per ID in request order."""
+        def respond(url, **kwargs):
+            norad = url.split("CATNR=")[1].split("&")[0]
+            return self._response(200, self.TLE_TEXT.replace("ISS (ZARYA)", f"SAT {norad}"))
+
+        mock_get.side_effect = respond
+        tles = pass_predictor.fetch_tles([25544, 20580, 28654])
+
+        self.assertEqual([name for name, _, _ in tles], ["SAT 25544", "SAT 20580", "SAT 28654"])
+        self.assertEqual(mock_get.call_count, 3)
+
+
 class TestPassEvent(unittest.TestCase):
     """Test PassEvent dataclass."""
 